@@ -1,16 +1,8 @@
 __version__ = '0.1.12'
 
 import datetime as _datetime
-
-import numpy as np
-import pandas as pd
-import pendulum as _pendulum
 import zoneinfo as _zoneinfo
 
-from typing_extensions import Optional
-from typing_extensions import Union
-from typing_extensions import overload
-
 from date.date import Date
 from date.date import DateTime
 from date.date import Entity
@@ -24,6 +16,7 @@ from date.date import NYSE
 from date.date import Time
 from date.date import WeekDay
 from date.date import WEEKDAY_SHORTNAME
+from date.date import _resolve_tz
 from date.date import expect_date
 from date.date import expect_datetime
 from date.date import expect_native_timezone
@@ -32,27 +25,42 @@ from date.date import prefer_native_timezone
 from date.date import prefer_utc_timezone
 from date.date import Timezone
 from date.extras import overlap_days
+from date.extras import overlap_days_vec
 from date.extras import is_business_day
 from date.extras import is_within_business_hours
 
 
 timezone = Timezone
-
-
-def date(*args, **kwargs):
-    return Date(*args, **kwargs)
-
-
-def datetime(*args, **kwargs):
-    return DateTime(*args, **kwargs)
-
-
-def time(*args, **kwargs):
-    return Time(*args, **kwargs)
-
-
-def interval(*args, **kwargs):
-    return Interval(*args, **kwargs)
+date = Date
+interval = Interval
+
+
+def datetime(
+    year: int,
+    month: int,
+    day: int,
+    hour: int = 0,
+    minute: int = 0,
+    second: int = 0,
+    microsecond: int = 0,
+    tzinfo: str | float | _datetime.tzinfo | None = None,
+    *,
+    fold: int = 0,
+) -> DateTime:
+    return DateTime(year, month, day, hour, minute, second, microsecond,
+                    _resolve_tz(tzinfo), fold=fold)
+
+
+def time(
+    hour: int = 0,
+    minute: int = 0,
+    second: int = 0,
+    microsecond: int = 0,
+    tzinfo: str | float | _datetime.tzinfo | None = None,
+    *,
+    fold: int = 0,
+) -> Time:
+    return Time(hour, minute, second, microsecond, _resolve_tz(tzinfo), fold=fold)
 
 
 def parse(s: str | None, fmt: str = None, entity: Entity = NYSE, raise_err: bool = False) -> DateTime | None:
@@ -61,9 +69,21 @@ def parse(s: str | None, fmt: str = None, entity: Entity = NYSE, raise_err: bool
     return DateTime.parse(s, entity=entity, raise_err=True)
 
 
+_INSTANCE_DISPATCH = {
+    _datetime.date: Date.instance,
+    _datetime.datetime: DateTime.instance,
+    _datetime.time: Time.instance,
+    Date: lambda obj: obj,
+    DateTime: lambda obj: obj,
+    Time: lambda obj: obj,
+    }
+
+
 def instance(obj: _datetime.date | _datetime.datetime | _datetime.time) -> DateTime | Date | Time:
     """Create a DateTime/Date/Time instance from a datetime/date/time native one.
     """
+    if (func := _INSTANCE_DISPATCH.get(type(obj))) is not None:
+        return func(obj)
     if isinstance(obj, _datetime.date) and not isinstance(obj, _datetime.datetime):
         return Date.instance(obj)
     if isinstance(obj, _datetime.time):
@@ -76,16 +96,16 @@ def instance(obj: _datetime.date | _datetime.datetime | _datetime.time) -> DateT
 def now(tz: str | _zoneinfo.ZoneInfo | None = None) -> DateTime:
     """Returns Datetime.now
     """
-    return DateTime.now(tz)
+    return DateTime.now(_resolve_tz(tz))
 
 
 def today(tz: str | _zoneinfo.ZoneInfo = None) -> DateTime:
     """Returns DateTime.today
     """
-    return DateTime.today(tz)
+    return DateTime.today(_resolve_tz(tz))
 
 
-__all__ = [
+__all__ = (
     'Date',
     'date',
     'DateTime',
@@ -105,6 +125,7 @@ __all__ = [
     'now',
     'NYSE',
     'overlap_days',
+    'overlap_days_vec',
     'parse',
     'prefer_native_timezone',
     'prefer_utc_timezone',
@@ -113,4 +134,4 @@ __all__ = [
     'timezone',
     'today',
     'WeekDay',
-    ]
+    )
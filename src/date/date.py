@@ -1,5 +1,6 @@
 import calendar
 import contextlib
+import copy
 import datetime as _datetime
 import logging
 import os
@@ -15,10 +16,8 @@ from typing import Self
 import dateutil as _dateutil
 import numpy as np
 import pandas as pd
-import pandas_market_calendars as mcal
 import pendulum as _pendulum
-
-warnings.simplefilter(action='ignore', category=DeprecationWarning)
+import regex
 
 logger = logging.getLogger(__name__)
 
@@ -40,11 +39,12 @@ __all__ = [
     'expect_date',
     'expect_datetime',
     'Entity',
-    'NYSE'
+    'NYSE',
     'WEEKDAY_SHORTNAME',
     ]
 
 
+@lru_cache(maxsize=64)
 def Timezone(name:str = 'US/Eastern') -> _zoneinfo.ZoneInfo:
     """Simple wrapper around Pendulum `Timezone`
 
@@ -77,6 +77,37 @@ GMT = Timezone('GMT')
 EST = Timezone('US/Eastern')
 LCL = _pendulum.tz.Timezone(_pendulum.tz.get_local_timezone().name)
 
+
+@lru_cache(maxsize=128)
+def _cached_timezone(tz: str | float) -> _datetime.tzinfo:
+    return _pendulum._safe_timezone(tz)
+
+
+def _resolve_tz(tz: str | float | _datetime.tzinfo | None) -> _datetime.tzinfo | None:
+    """Resolve a timezone name or hour offset to a cached timezone
+
+    Keyed zoneinfo objects land on the same cached Pendulum timezone as
+    their name; other tzinfo objects (and None) are passed through.
+
+    >>> _resolve_tz('US/Eastern') is _resolve_tz('US/Eastern')
+    True
+    >>> _resolve_tz(-5)
+    FixedTimezone(-18000, name="-05:00")
+    >>> _resolve_tz(UTC) is UTC
+    True
+    >>> _resolve_tz(_zoneinfo.ZoneInfo('US/Eastern')) is EST
+    True
+    >>> _resolve_tz(None)
+    """
+    if tz is None or isinstance(tz, _pendulum.Timezone | _pendulum.FixedTimezone):
+        return tz
+    if isinstance(tz, _zoneinfo.ZoneInfo) and tz.key:
+        return _cached_timezone(tz.key)
+    if isinstance(tz, _datetime.tzinfo):
+        return tz
+    return _cached_timezone(tz)
+
+
 WeekDay = _pendulum.day.WeekDay
 
 WEEKDAY_SHORTNAME = {
@@ -89,6 +120,10 @@ WEEKDAY_SHORTNAME = {
     'SU': WeekDay.SUNDAY
 }
 
+# plain ints, enum member lookups are slow on hot weekday checks
+_WEDNESDAY = int(WeekDay.WEDNESDAY)
+_FRIDAY = int(WeekDay.FRIDAY)
+
 
 MONTH_SHORTNAME = {
     'jan': 1,
@@ -105,9 +140,111 @@ MONTH_SHORTNAME = {
     'dec': 12,
 }
 
+# common spellings (JUN, Jun, jun, June, JUNE, june) looked up verbatim
+MONTH_LOOKUP = {
+    k: v
+    for month, v in MONTH_SHORTNAME.items()
+    for name in (month, calendar.month_name[v].lower())
+    for k in (name, name.upper(), name.capitalize())
+}
+
 DATEMATCH = re.compile(r'^(?P<d>N|T|Y|P|M)(?P<n>[-+]?\d+)?(?P<b>b?)?$')
 
 
+def _parse_shortcode(s: str) -> tuple[str, int | None, bool] | None:
+    """Hand rolled `DATEMATCH`: symbol, optional signed offset, business flag
+
+    >>> _parse_shortcode('T-3b')
+    ('T', -3, True)
+    >>> _parse_shortcode('P')
+    ('P', None, False)
+    >>> _parse_shortcode('Y+2')
+    ('Y', 2, False)
+    >>> _parse_shortcode('Tuesday') is None
+    True
+    """
+    if not s or s[0] not in 'NTYPM':
+        return
+    rest = s[1:]
+    b = rest.endswith('b')
+    if b:
+        rest = rest[:-1]
+    if not rest:
+        return s[0], None, b
+    if not (rest[1:] if rest[0] in '+-' else rest).isdecimal():
+        return
+    return s[0], int(rest), b
+
+
+def _parse_iso_datetime(s: str) -> _datetime.datetime | None:
+    """ISO 8601 (yyyy-mm-dd or yyyy/mm/dd, optional time and offset) via
+    the C `fromisoformat`, offsets mapped to the tzinfo dateutil would give.
+    None when the string is not ISO shaped or carries a UTC designator.
+
+    >>> _parse_iso_datetime('2014-10-31T14:55:00.25')
+    datetime.datetime(2014, 10, 31, 14, 55, 0, 250000)
+    >>> _parse_iso_datetime('2014/10/31 14:55:00-04:00')
+    datetime.datetime(2014, 10, 31, 14, 55, tzinfo=tzoffset(None, -14400))
+    >>> _parse_iso_datetime('2014-10-31T14:55:00Z')
+    >>> _parse_iso_datetime('Fri, 31 Oct 2014')
+    """
+    if len(s) < 10 or s[4] != s[7] or s[4] not in '-/':
+        return
+    if s[4] == '/':
+        s = s[:4] + '-' + s[5:7] + '-' + s[8:]
+    try:
+        d = _datetime.datetime.fromisoformat(s)
+    except ValueError:
+        return
+    if d.tzinfo is not None:
+        offset = d.utcoffset()
+        if not offset:  # dateutil may resolve UTC to tzlocal, leave those to it
+            return
+        d = d.replace(tzinfo=_cached_tzoffset(offset))
+    return d
+
+
+@lru_cache(maxsize=64)
+def _cached_tzoffset(offset: _datetime.timedelta) -> _datetime.tzinfo:
+    return _dateutil.tz.tzoffset(None, offset.total_seconds())
+
+
+# two digit years follow the dateutil rolling century window
+DATEUTIL_PARSERINFO = _dateutil.parser.parserinfo()
+
+
+def _compile_branches(*exps):
+    """Single anchored pattern trying each expression in order. Branch
+    reset lets every alternative share the same group names.
+    """
+    return regex.compile('^(?|' + '|'.join(exps) + ')$')
+
+
+# Date formats with month numbers
+DATE_NUMERIC_MATCH = _compile_branches(
+    r'(?P<m>\d{1,2})[/-](?P<d>\d{1,2})[/-](?P<y>\d{4})',
+    r'(?P<m>\d{1,2})[/-](?P<d>\d{1,2})[/-](?P<y>\d{1,2})',
+    r'(?P<m>\d{1,2})[/-](?P<d>\d{1,2})',
+    r'(?P<y>\d{4})-(?P<m>\d{1,2})-(?P<d>\d{1,2})',
+    r'(?P<y>\d{4})(?P<m>\d{2})(?P<d>\d{2})',
+)
+
+# Date formats with month names
+DATE_MONTHNAME_MATCH = _compile_branches(
+    r'(?P<d>\d{1,2})[- ](?P<m>[A-Za-z]{3,})[- ](?P<y>\d{4})',
+    r'(?P<m>[A-Za-z]{3,})[- ](?P<d>\d{1,2})[- ](?P<y>\d{4})',
+    r'(?P<m>[A-Za-z]{3,}) (?P<d>\d{1,2}), (?P<y>\d{4})',
+    r'(?P<d>\d{2})(?P<m>[A-Z][a-z]{2})(?P<y>\d{4})',
+    r'(?P<d>\d{1,2})-(?P<m>[A-Z][a-z][a-z])-(?P<y>\d{2})',
+    r'(?P<d>\d{1,2})-(?P<m>[A-Z]{3})-(?P<y>\d{2})',
+)
+
+TIME_MATCH = _compile_branches(
+    r'(?P<h>\d{1,2})[:.](?P<m>\d{2})(?:[:.](?P<s>\d{2})(?:[.,](?P<u>\d+))?)?(?: +(?P<ap>[aApP][mM]))?',
+    r'(?P<h>\d{2})(?P<m>\d{2})(?:(?P<s>\d{2})(?:[.,](?P<u>\d+))?)?(?: +(?P<ap>[aApP][mM]))?',
+)
+
+
 # def caller_entity(func):
     # """Helper to get current entity from function"""
     # # general frame args inspect
@@ -124,44 +261,101 @@ DATEMATCH = re.compile(r'^(?P<d>N|T|Y|P|M)(?P<n>[-+]?\d+)?(?P<b>b?)?$')
 
 
 def isdateish(x):
-    return isinstance(x, _datetime.date | _datetime.datetime | pd.Timestamp | np.datetime64)
+    """Date-like value: date, datetime, Timestamp or datetime64
+
+    >>> isdateish(Date(2022, 1, 1)), isdateish(np.datetime64('2022-01-01')), isdateish('2022-01-01')
+    (True, True, False)
+    """
+    return _isdateish_type(type(x))
+
+
+@lru_cache(maxsize=256)
+def _isdateish_type(cls: type) -> bool:
+    return issubclass(cls, _datetime.date | _datetime.datetime | pd.Timestamp | np.datetime64)
+
+
+@lru_cache(maxsize=256)
+def _issequence_type(cls: type) -> bool:
+    return issubclass(cls, Sequence) and not issubclass(cls, str)
+
+
+def _arg_converter(typ: type, cls: type) -> Callable | None:
+    """Converter for an argument type, None when it passes through
+    """
+    if not _isdateish_type(cls):
+        return
+    target = _ARG_TARGETS.get(typ)
+    if target is None or cls is target:  # instance() would return it unchanged
+        return
+    return target.instance
+
+
+# marks argument classes parse_args recurses into
+_SEQUENCE = object()
+
+# expect() target type to {argument class: converter, _SEQUENCE or None}
+_ARG_PLANS: dict[type, dict[type, Callable | object | None]] = {}
+
+
+def _arg_plans(typ) -> dict:
+    try:
+        return _ARG_PLANS[typ]
+    except KeyError:
+        return _ARG_PLANS.setdefault(typ, {})
+
+
+def _arg_plan(typ, plans: dict, cls: type):
+    """Plan for an argument class, resolved on first sight
+    """
+    try:
+        return plans[cls]
+    except KeyError:
+        plan = plans[cls] = _SEQUENCE if _issequence_type(cls) else _arg_converter(typ, cls)
+        return plan
 
 
 def parse_arg(typ, arg):
-    if isdateish(arg):
-        if typ == _datetime.datetime:
-            return DateTime.instance(arg)
-        if typ == _datetime.date:
-            return Date.instance(arg)
-        if typ == _datetime.time:
-            return Time.instance(arg)
-    return arg
+    plan = _arg_plan(typ, _arg_plans(typ), type(arg))
+    if plan is None or plan is _SEQUENCE:
+        return arg
+    return plan(arg)
 
 
 def parse_args(typ, *args):
-    this = []
+    return _convert_args(typ, _arg_plans(typ), args)
+
+
+def _convert_args(typ, plans: dict, args) -> list:
+    """One plan lookup per argument, recursing into sequences
+    """
+    out = []
     for a in args:
-        if isinstance(a, Sequence) and not isinstance(a, str):
-            this.append(parse_args(typ, *a))
+        plan = _arg_plan(typ, plans, type(a))
+        if plan is None:
+            out.append(a)
+        elif plan is _SEQUENCE:
+            out.append(_convert_args(typ, plans, a))
         else:
-            this.append(parse_arg(typ, a))
-    return this
+            out.append(plan(a))
+    return out
 
 
-def expect(func, typ: type[_datetime.date], exclkw: bool = False) -> Callable:
+def expect(func=None, typ: type[_datetime.date] = None, exclkw: bool = False) -> Callable:
     """Decorator to force input type of date/datetime inputs
     """
+    if func is None:
+        return partial(expect, typ=typ, exclkw=exclkw)
+    convert_kwargs = not exclkw and typ != _datetime.time
+    plans = _arg_plans(typ)
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        args = parse_args(typ, *args)
-        if not exclkw:
+        args = _convert_args(typ, plans, args)
+        if kwargs and convert_kwargs:
             for k, v in kwargs.items():
-                if isdateish(v):
-                    if typ == _datetime.datetime:
-                        kwargs[k] = DateTime.instance(v)
-                        continue
-                    if typ == _datetime.date:
-                        kwargs[k] = Date.instance(v)
+                plan = _arg_plan(typ, plans, type(v))
+                if plan is not None and plan is not _SEQUENCE:
+                    kwargs[k] = plan(v)
         return func(*args, **kwargs)
     return wrapper
 
@@ -174,36 +368,76 @@ expect_time = partial(expect, typ=_datetime.time)
 def type_class(typ, obj):
     if typ:
         return typ
-    if obj.__class__ in {_datetime.datetime, _pendulum.DateTime, DateTime}:
-        return DateTime
-    if obj.__class__ in {_datetime.date, _pendulum.Date, Date}:
-        return Date
-    raise ValueError(f'Unknown type {typ}')
+    return _type_class(obj.__class__)
+
+
+# exact class to Date/DateTime, filled in once the classes exist
+_TYPE_MAP: dict[type, type] = {}
+
+# expect() target type to the class whose instance() converts to it
+_ARG_TARGETS: dict[type, type] = {}
+
+
+def _type_class(cls: type) -> type:
+    try:
+        return _TYPE_MAP[cls]
+    except KeyError:
+        raise ValueError(f'Unknown type {cls}') from None
 
 
 def store_entity(func=None, *, typ=None):
+    if func is None:
+        return partial(store_entity, typ=typ)
+    if typ:
+        instance = typ.instance
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            _entity = self._entity
+            d = instance(func(self, *args, **kwargs))
+            if d._entity is not _entity:
+                d._entity = _entity
+            return d
+        return wrapper
+
     @wraps(func)
     def wrapper(self, *args, **kwargs):
         _entity = self._entity
-        d = type_class(typ, self).instance(func(self, *args, **kwargs))
-        d._entity = _entity
+        d = _type_class(self.__class__).instance(func(self, *args, **kwargs))
+        if d._entity is not _entity:
+            d._entity = _entity
         return d
-    if func is None:
-        return partial(store_entity, typ=typ)
     return wrapper
 
 
 def store_both(func=None, *, typ=None):
+    if func is None:
+        return partial(store_both, typ=typ)
+    if typ:
+        instance = typ.instance
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            _entity = self._entity
+            _business = self._business
+            d = instance(func(self, *args, **kwargs))
+            if d._entity is not _entity:
+                d._entity = _entity
+            if d._business != _business:
+                d._business = _business
+            return d
+        return wrapper
+
     @wraps(func)
     def wrapper(self, *args, **kwargs):
         _entity = self._entity
         _business = self._business
-        d = type_class(typ, self).instance(func(self, *args, **kwargs))
-        d._entity = _entity
-        d._business = _business
+        d = _type_class(self.__class__).instance(func(self, *args, **kwargs))
+        if d._entity is not _entity:
+            d._entity = _entity
+        if d._business != _business:
+            d._business = _business
         return d
-    if func is None:
-        return partial(store_both, typ=typ)
     return wrapper
 
 
@@ -213,9 +447,9 @@ def prefer_utc_timezone(func, force:bool = False):
     @wraps(func)
     def wrapper(*args, **kwargs):
         d = func(*args, **kwargs)
-        if not d:
+        if d is None:
             return
-        if not force and d.tzinfo:
+        if not force and d.tzinfo is not None:
             return d
         return d.replace(tzinfo=UTC)
     return wrapper
@@ -227,9 +461,9 @@ def prefer_native_timezone(func, force:bool = False):
     @wraps(func)
     def wrapper(*args, **kwargs):
         d = func(*args, **kwargs)
-        if not d:
+        if d is None:
             return
-        if not force and d.tzinfo:
+        if not force and d.tzinfo is not None:
             return d
         return d.replace(tzinfo=LCL)
     return wrapper
@@ -239,11 +473,84 @@ expect_native_timezone = partial(prefer_native_timezone, force=True)
 expect_utc_timezone = partial(prefer_utc_timezone, force=True)
 
 
+def _is_missing(obj) -> bool:
+    """Scalar null check covering the values `pd.isna` treats as missing
+
+    >>> _is_missing(None), _is_missing(pd.NaT), _is_missing(np.datetime64('NaT'))
+    (True, True, True)
+    >>> _is_missing(float('nan')), _is_missing(pd.NA), _is_missing(_datetime.date(2022, 1, 1))
+    (True, True, False)
+    >>> import decimal
+    >>> _is_missing(np.float32('nan')), _is_missing(decimal.Decimal('NaN'))
+    (True, True)
+    """
+    if obj is None or obj is _NaT or obj is _NA:
+        return True
+    if isinstance(obj, float):
+        return obj != obj
+    if isinstance(obj, _NP_TIMES):
+        return bool(_isnat(obj))
+    if isinstance(obj, _NEVER_MISSING):
+        return False
+    # exotic scalars (numpy floats, Decimal, ...) are left to pandas
+    return np.ndim(obj) == 0 and bool(pd.isna(obj))
+
+
+# bound once, _is_missing runs ahead of every instance() conversion
+_NaT, _NA, _isnat = pd.NaT, pd.NA, np.isnat
+_NP_TIMES = (np.datetime64, np.timedelta64)
+_NEVER_MISSING = (_datetime.date, _datetime.time, str)
+
+
+# local date with the epoch-second span [start, end) it is valid for
+_LOCAL_TODAY: tuple[float, float, _datetime.date | None] = (0.0, 0.0, None)
+
+
+def _local_today() -> _datetime.date:
+    """Local calendar date, re-read from the clock only when the day rolls
+
+    >>> _local_today() == _datetime.datetime.now(LCL).date()
+    True
+    """
+    global _LOCAL_TODAY
+    start, end, today = _LOCAL_TODAY
+    if start <= time.time() < end:
+        return today
+    today = _datetime.datetime.now(LCL).date()
+    midnight = _datetime.datetime.combine(today, _datetime.time(), tzinfo=LCL)
+    start = midnight.timestamp()
+    end = (midnight + _datetime.timedelta(days=1)).timestamp()
+    _LOCAL_TODAY = (start, end, today)
+    return today
+
+
+EPOCH_ORDINAL = _datetime.date(1970, 1, 1).toordinal()
+
+
+def _ordinals_to_dates(ordinals: np.ndarray) -> list:
+    """Proleptic ordinals to datetime.date in one numpy pass"""
+    return (np.asarray(ordinals, dtype=np.int64) - EPOCH_ORDINAL).astype('datetime64[D]').tolist()
+
+
+def _datetime64_values(arr, unit: str) -> list:
+    """Datetime-like array to Python date/datetime objects (None for NaT)
+
+    Timezone-aware input keeps its wall time, as `instance` does.
+    """
+    values = pd.DatetimeIndex(arr)
+    if values.tz is not None:
+        values = values.tz_localize(None)
+    return values.to_numpy().astype(f'datetime64[{unit}]').tolist()
+
+
 class Entity(ABC):
     """ABC for named entity types"""
 
     tz = UTC
 
+    BEGDATE = _datetime.date(1900, 1, 1)
+    ENDDATE = _datetime.date(2200, 1, 1)
+
     @staticmethod
     @abstractmethod
     def business_days(begdate: _datetime.date, enddate: _datetime.date):
@@ -259,37 +566,249 @@ class Entity(ABC):
     def business_holidays(begdate: _datetime.date, enddate: _datetime.date):
         """Returns only holidays over a range"""
 
+    @classmethod
+    def business_day_ordinals(cls, begdate: _datetime.date, enddate: _datetime.date) -> np.ndarray:
+        """Ordinals of all business days over a range"""
+        days = cls.business_days(begdate, enddate)
+        ordinals = np.fromiter(map(_datetime.date.toordinal, days), dtype=np.int64, count=len(days))
+        ordinals.sort()
+        return ordinals
+
+    @classmethod
+    @lru_cache
+    def _business_day_bitmap(cls) -> np.ndarray:
+        """Business day flags indexed by ordinal offset from BEGDATE,
+        a read-only view over bytes (its .base) for scalar lookups
+        """
+        base = cls.BEGDATE.toordinal()
+        bitmap = np.zeros(cls.ENDDATE.toordinal() - base + 1, dtype=np.uint8)
+        bitmap[cls.business_day_ordinals(cls.BEGDATE, cls.ENDDATE) - base] = 1
+        return np.frombuffer(bitmap.tobytes(), dtype=np.uint8)
+
+    @classmethod
+    def _is_business_ordinal(cls, ordinal: int) -> bool:
+        """Bitmap lookup, dates outside BEGDATE/ENDDATE are never business days"""
+        flags = cls._business_day_bitmap().base
+        i = ordinal - cls.BEGDATE.toordinal()
+        return 0 <= i < len(flags) and flags[i] == 1
+
+    @classmethod
+    @lru_cache
+    def _business_day_rank(cls) -> np.ndarray:
+        """Count of business days on or before each ordinal offset from BEGDATE"""
+        rank = np.cumsum(cls._business_day_bitmap(), dtype=np.int32)
+        rank.flags.writeable = False
+        return rank
+
+    @classmethod
+    @lru_cache
+    def _business_day_ordinals(cls) -> np.ndarray:
+        """Sorted ordinals of all business days"""
+        ordinals = np.flatnonzero(cls._business_day_bitmap()) + cls.BEGDATE.toordinal()
+        ordinals.flags.writeable = False
+        return ordinals
+
+    @classmethod
+    def _business_ordinal_offset(cls, ordinal: int, days: int) -> int | None:
+        """Ordinal of the Nth business day after (days > 0) or before (days < 0)
+        the given ordinal, or None when outside the precomputed range.
+        """
+        rank = cls._business_day_rank()
+        i = ordinal - cls.BEGDATE.toordinal()
+        if not 0 <= i < len(rank):
+            return
+        ordinals = cls._business_day_ordinals()
+        if days > 0:
+            j = rank[i] + days - 1
+        else:
+            j = rank[i] - cls._business_day_bitmap()[i] + days
+        if not 0 <= j < len(ordinals):
+            return
+        return int(ordinals[j])
+
+    @classmethod
+    def _business_day_count(cls, lo: int, hi: int) -> int | None:
+        """Business days in the inclusive ordinal range [lo, hi], or None
+        when outside the precomputed range.
+        """
+        rank = cls._business_day_rank()
+        base = cls.BEGDATE.toordinal()
+        if not (0 <= lo - base <= hi - base < len(rank)):
+            return
+        return int(rank[hi - base] - rank[lo - base] + cls._business_day_bitmap()[lo - base])
+
+    @classmethod
+    def is_business_day_vec(cls, ordinals) -> np.ndarray:
+        """Business day flags for an array of ordinals (False outside range)
+
+        >>> import datetime
+        >>> NYSE.is_business_day_vec([datetime.date(2024, 12, d).toordinal() for d in (24, 25)])
+        array([ True, False])
+        """
+        bitmap = cls._business_day_bitmap()
+        i = np.asarray(ordinals, dtype=np.int64) - cls.BEGDATE.toordinal()
+        inside = (i >= 0) & (i < len(bitmap))
+        return inside & (bitmap[np.where(inside, i, 0)] != 0)
+
+    @classmethod
+    def add_business_days_vec(cls, ordinals, days) -> np.ndarray:
+        """Ordinals shifted by business days, same rules as `b.add(days=n)`
+
+        A zero shift rolls non business days forward.
+
+        >>> import datetime
+        >>> d = datetime.date(2024, 12, 24).toordinal()
+        >>> [datetime.date.fromordinal(o) for o in NYSE.add_business_days_vec([d, d], [1, -1])]
+        [datetime.date(2024, 12, 26), datetime.date(2024, 12, 23)]
+        """
+        bitmap, rank = cls._business_day_bitmap(), cls._business_day_rank()
+        business = cls._business_day_ordinals()
+        i = np.asarray(ordinals, dtype=np.int64) - cls.BEGDATE.toordinal()
+        days = np.asarray(days, dtype=np.int64)
+        if ((i < 0) | (i >= len(bitmap))).any():
+            raise ValueError('Dates outside of the entity calendar range')
+        j = np.where(days > 0, rank[i] + days - 1, rank[i] - bitmap[i] + days)
+        if ((j < 0) | (j >= len(business))).any():
+            raise ValueError('Business day shift outside of the entity calendar range')
+        return business[j]
+
+    @classmethod
+    @lru_cache
+    def _busdaycalendar(cls) -> np.busdaycalendar:
+        """Numpy business day calendar built from the bitmap. Every closed
+        day is listed as a holiday since weekend sessions did occur (NYSE
+        traded Saturdays until 1952), so no weekmask can describe it.
+        """
+        bitmap = cls._business_day_bitmap()
+        days = np.flatnonzero(bitmap == 0) + (cls.BEGDATE.toordinal() - EPOCH_ORDINAL)
+        return np.busdaycalendar(weekmask='1111111', holidays=days.astype('datetime64[D]'))
+
+    @classmethod
+    def shift(cls, dates, n: int) -> np.ndarray:
+        """Shift an array of dates by `n` business days with `np.busday_offset`
+
+        Same rules as `b.add(days=n)`: a zero shift rolls closed days forward.
+
+        >>> NYSE.shift(['2024-12-24', '2024-12-25'], 1)
+        array(['2024-12-26', '2024-12-26'], dtype='datetime64[D]')
+        >>> NYSE.shift(['2024-12-24', '2024-12-25'], -1)
+        array(['2024-12-23', '2024-12-24'], dtype='datetime64[D]')
+        """
+        dates = np.asarray(dates, dtype='datetime64[D]')
+        begdate, enddate = np.datetime64(cls.BEGDATE, 'D'), np.datetime64(cls.ENDDATE, 'D')
+        if ((dates < begdate) | (dates > enddate)).any():
+            raise ValueError('Dates outside of the entity calendar range')
+        roll = 'backward' if n > 0 else 'forward'
+        shifted = np.busday_offset(dates, n, roll=roll, busdaycal=cls._busdaycalendar())
+        if ((shifted < begdate) | (shifted > enddate)).any():
+            raise ValueError('Business day shift outside of the entity calendar range')
+        return shifted
+
+
+class _MarketCalendar:
+    """Class attribute loading a `pandas_market_calendars` calendar on
+    first access, keeping the (slow) import out of `import date`
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __set_name__(self, owner, attr):
+        self.attr = attr
+
+    def __get__(self, obj, owner):
+        import pandas_market_calendars as mcal
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
+            calendar = mcal.get_calendar(self.name)
+        setattr(owner, self.attr, calendar)
+        return calendar
+
 
 class NYSE(Entity):
     """New York Stock Exchange"""
 
     BEGDATE = _datetime.date(1900, 1, 1)
     ENDDATE = _datetime.date(2200, 1, 1)
-    calendar = mcal.get_calendar('NYSE')
+    calendar = _MarketCalendar('NYSE')
 
     tz = EST
 
     @staticmethod
     @lru_cache
-    def business_days(begdate=BEGDATE, enddate=ENDDATE) -> set:
-        return {Date.instance(d.date())
-                for d in NYSE.calendar.valid_days(begdate, enddate)}
+    def business_days(begdate=BEGDATE, enddate=ENDDATE) -> frozenset:
+        return frozenset(map(Date.instance, _ordinals_to_dates(
+            NYSE.business_day_ordinals(begdate, enddate))))
+
+    @staticmethod
+    @lru_cache
+    def business_day_ordinals(begdate=BEGDATE, enddate=ENDDATE) -> np.ndarray:
+        if (begdate, enddate) == (NYSE.BEGDATE, NYSE.ENDDATE) \
+                or not isinstance(begdate, _datetime.date) \
+                or not isinstance(enddate, _datetime.date):
+            return NYSE._valid_day_ordinals(begdate, enddate)
+        # sub-ranges are cut from per-year schedules shared between queries
+        years = range(begdate.year, enddate.year + 1)
+        if not years:
+            return NYSE._valid_day_ordinals(begdate, enddate)
+        ordinals = np.concatenate([NYSE._year_business_day_ordinals(y) for y in years])
+        lo, hi = np.searchsorted(ordinals, [begdate.toordinal(), enddate.toordinal() + 1])
+        ordinals = ordinals[lo:hi]
+        ordinals.flags.writeable = False
+        return ordinals
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _year_business_day_ordinals(year: int) -> np.ndarray:
+        return NYSE._valid_day_ordinals(_datetime.date(year, 1, 1), _datetime.date(year, 12, 31))
+
+    @staticmethod
+    def _valid_day_ordinals(begdate, enddate) -> np.ndarray:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
+            days = NYSE.calendar.valid_days(begdate, enddate)
+        ordinals = days.values.astype('datetime64[D]').astype(np.int64) + EPOCH_ORDINAL
+        ordinals.flags.writeable = False  # shared through the cache
+        return ordinals
 
     @staticmethod
     @lru_cache
     def business_hours(begdate=BEGDATE, enddate=ENDDATE) -> dict:
-        df = NYSE.calendar.schedule(begdate, enddate, tz=EST)
-        open_close = [(DateTime.instance(o.to_pydatetime()),
-                       DateTime.instance(c.to_pydatetime()))
-                      for o, c in zip(df.market_open, df.market_close)]
+        if (begdate, enddate) == (NYSE.BEGDATE, NYSE.ENDDATE) \
+                or not isinstance(begdate, _datetime.date) \
+                or not isinstance(enddate, _datetime.date):
+            return NYSE._schedule_hours(begdate, enddate)
+        # sub-ranges (a single day for Date.business_hours) share per-year schedules
+        lo, hi = begdate.toordinal(), enddate.toordinal()
+        return {d: open_close
+                for year in range(begdate.year, enddate.year + 1)
+                for d, open_close in NYSE._year_business_hours(year).items()
+                if lo <= d.toordinal() <= hi}
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _year_business_hours(year: int) -> dict:
+        return NYSE._schedule_hours(_datetime.date(year, 1, 1), _datetime.date(year, 12, 31))
+
+    @staticmethod
+    def _schedule_hours(begdate, enddate) -> dict:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
+            df = NYSE.calendar.schedule(begdate, enddate, tz=EST)
+        opens = pd.DatetimeIndex(df.market_open).to_pydatetime()
+        closes = pd.DatetimeIndex(df.market_close).to_pydatetime()
+        open_close = zip(map(DateTime.instance, opens), map(DateTime.instance, closes))
         return dict(zip(df.index.date, open_close))
 
     @staticmethod
     @lru_cache
-    def business_holidays(begdate=BEGDATE, enddate=ENDDATE) -> set:
-        return {Date.instance(d.date())
-                for d in map(pd.to_datetime, NYSE.calendar.holidays().holidays)
-                if begdate <= d <= enddate}
+    def business_holidays(begdate=BEGDATE, enddate=ENDDATE) -> frozenset:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
+            holidays = NYSE.calendar.holidays().holidays
+        days = np.asarray(holidays, dtype='datetime64[D]')
+        days = days[(days >= np.datetime64(begdate, 'D')) & (days <= np.datetime64(enddate, 'D'))]
+        return frozenset(map(Date.instance, days.tolist()))
 
 
 class DateBusinessMixin:
@@ -309,23 +828,43 @@ class DateBusinessMixin:
         self._entity = entity
         return self
 
+    def _take_business(self) -> bool:
+        """Read and clear the business flag, only writing when it was set
+        so plain instances never grow a populated `__dict__`
+        """
+        if self._business:
+            self._business = False
+            return True
+        return False
+
+    def _with_entity(self, d):
+        """Carry this instance's entity onto a value derived from it
+        """
+        if d._entity is not self._entity:
+            d._entity = self._entity
+        return d
+
+    def __copy__(self) -> Self:
+        """Pendulum reduces to constructor args only, carry entity state over
+        """
+        cls, args = self.__reduce__()[:2]
+        d = cls(*args)
+        d.__dict__.update(self.__dict__)
+        return d
+
     @store_entity
     def add(self, years: int = 0, months: int = 0, weeks: int = 0, days: int = 0, **kwargs) -> Self:
         """Add wrapper
         If not business use Pendulum
         If business assume only days (for now) and use local logic
         """
-        _business = self._business
-        self._business = False
+        _business = self._take_business()
         if _business:
             if days == 0:
                 return self._business_or_next()
             if days < 0:
                 return self.business().subtract(days=abs(days))
-            while days > 0:
-                self = self._business_next(days=1)
-                days -= 1
-            return self
+            return self._business_next(days=days)
         return super().add(years, months, weeks, days, **kwargs)
 
     @store_entity
@@ -334,17 +873,13 @@ class DateBusinessMixin:
         If not business use Pendulum
         If business assume only days (for now) and use local logic
         """
-        _business = self._business
-        self._business = False
+        _business = self._take_business()
         if _business:
             if days == 0:
                 return self._business_or_previous()
             if days < 0:
                 return self.business().add(days=abs(days))
-            while days > 0:
-                self = self._business_previous(days=1)
-                days -= 1
-            return self
+            return self._business_previous(days=days)
         kwargs = {k: -1*v for k,v in kwargs.items()}
         return super().add(-years, -months, -weeks, -days, **kwargs)
 
@@ -353,8 +888,7 @@ class DateBusinessMixin:
         """Returns an instance set to the first occurrence
         of a given day of the week in the current unit.
         """
-        _business = self._business
-        self._business = False
+        _business = self._take_business()
         self = super().first_of(unit, day_of_week)
         if _business:
             self = self._business_or_next()
@@ -365,8 +899,7 @@ class DateBusinessMixin:
         """Returns an instance set to the last occurrence
         of a given day of the week in the current unit.
         """
-        _business = self._business
-        self._business = False
+        _business = self._take_business()
         self = super().last_of(unit, day_of_week)
         if _business:
             self = self._business_or_previous()
@@ -376,8 +909,7 @@ class DateBusinessMixin:
     def start_of(self, unit: str) -> Self:
         """Returns a copy of the instance with the time reset
         """
-        _business = self._business
-        self._business = False
+        _business = self._take_business()
         self = super().start_of(unit)
         if _business:
             self = self._business_or_next()
@@ -387,8 +919,7 @@ class DateBusinessMixin:
     def end_of(self, unit: str) -> Self:
         """Returns a copy of the instance with the time reset
         """
-        _business = self._business
-        self._business = False
+        _business = self._take_business()
         self = super().end_of(unit)
         if _business:
             self = self._business_or_previous()
@@ -398,8 +929,7 @@ class DateBusinessMixin:
     def previous(self, day_of_week: WeekDay | None = None) -> Self:
         """Modify to the previous occurrence of a given day of the week.
         """
-        _business = self._business
-        self._business = False
+        _business = self._take_business()
         self = super().previous(day_of_week)
         if _business:
             self = self._business_or_next()
@@ -409,8 +939,7 @@ class DateBusinessMixin:
     def next(self, day_of_week: WeekDay | None = None) -> Self:
         """Modify to the next occurrence of a given day of the week.
         """
-        _business = self._business
-        self._business = False
+        _business = self._take_business()
         self = super().next(day_of_week)
         if _business:
             self = self._business_or_previous()
@@ -452,7 +981,7 @@ class DateBusinessMixin:
         >>> thedate.is_business_day()
         True
         """
-        return self in self._entity.business_days()
+        return self._entity._is_business_ordinal(self.toordinal())
 
     @expect_date
     def business_hours(self) -> 'tuple[DateTime, DateTime]':
@@ -479,10 +1008,19 @@ class DateBusinessMixin:
         return self._entity.business_hours(self, self)\
             .get(self, (None, None))
 
+    def _at_ordinal(self, o: int) -> Self:
+        """Move to ordinal `o`, dates skip Pendulum's duration arithmetic
+        """
+        if isinstance(self, _datetime.datetime):
+            return super().add(days=o - self.toordinal())
+        return self.fromordinal(o)
+
     @store_both
     def _business_next(self, days=0):
         """Helper for cycling through N business day"""
         days = abs(days)
+        if days and (o := self._entity._business_ordinal_offset(self.toordinal(), days)) is not None:
+            return self._at_ordinal(o)
         while days > 0:
             try:
                 self = super().add(days=1)
@@ -496,6 +1034,8 @@ class DateBusinessMixin:
     def _business_previous(self, days=0):
         """Helper for cycling through N business day"""
         days = abs(days)
+        if days and (o := self._entity._business_ordinal_offset(self.toordinal(), -days)) is not None:
+            return self._at_ordinal(o)
         while days > 0:
             try:
                 self = super().add(days=-1)
@@ -507,14 +1047,14 @@ class DateBusinessMixin:
 
     @store_entity
     def _business_or_next(self):
-        self._business = False
+        self._take_business()
         self = super().subtract(days=1)
         self = self._business_next(days=1)
         return self
 
     @store_entity
     def _business_or_previous(self):
-        self._business = False
+        self._take_business()
         self = super().add(days=1)
         self = self._business_previous(days=1)
         return self
@@ -551,8 +1091,7 @@ class DateExtrasMixin:
         >>> Date(2015, 1, 31).b.nearest_start_of_month()
         Date(2015, 2, 2)
         """
-        _business = self._business
-        self._business = False
+        _business = self._take_business()
         if self.day > 15:
             d = self.end_of('month')
             if _business:
@@ -583,8 +1122,7 @@ class DateExtrasMixin:
         >>> Date(2015, 1, 31).b.nearest_end_of_month()
         Date(2015, 1, 30)
         """
-        _business = self._business
-        self._business = False
+        _business = self._take_business()
         if self.day <= 15:
             d = self.start_of('month')
             if _business:
@@ -604,9 +1142,12 @@ class DateExtrasMixin:
         >>> Date(2020, 5, 24).next_relative_date_of_week_by_day('SU')
         Date(2020, 5, 24)
         """
-        if self.weekday() == WEEKDAY_SHORTNAME.get(day):
+        weekday = WEEKDAY_SHORTNAME.get(day)
+        if weekday is None or self._business:
+            return self.next(weekday)
+        if (days := (weekday - self.weekday()) % 7) == 0:
             return self
-        return self.next(WEEKDAY_SHORTNAME.get(day))
+        return self.add(days=days)
 
     def weekday_or_previous_friday(self):
         """Return the date if it is a weekday, else previous Friday
@@ -622,7 +1163,7 @@ class DateExtrasMixin:
         Date(2019, 10, 3)
         """
         dnum = self.weekday()
-        if dnum in {WeekDay.SATURDAY, WeekDay.SUNDAY}:
+        if dnum > _FRIDAY:
             return self.subtract(days=dnum - 4)
         return self
 
@@ -647,11 +1188,21 @@ class DateExtrasMixin:
         >>> Date.third_wednesday(2023, 6)
         Date(2023, 6, 21)
         """
-        third = cls(year, month, 15)  # lowest 3rd day
-        w = third.weekday()
-        if w != WeekDay.WEDNESDAY:
-            third = third.replace(day=(15 + (WeekDay.WEDNESDAY - w) % 7))
-        return third
+        w = calendar.weekday(year, month, 15)  # lowest 3rd day
+        return cls(year, month, 15 + (_WEDNESDAY - w) % 7)
+
+    @staticmethod
+    def third_wednesdays(years, months) -> np.ndarray:
+        """Vectorized `third_wednesday` over arrays of years and months
+
+        >>> from date import Date
+        >>> Date.third_wednesdays([2022, 2022, 2023], [6, 12, 6])
+        array(['2022-06-15', '2022-12-21', '2023-06-21'], dtype='datetime64[D]')
+        """
+        months = (np.asarray(years) - 1970) * 12 + np.asarray(months) - 1
+        fifteenth = months.astype('datetime64[M]').astype('datetime64[D]') + 14
+        w = (fifteenth.astype(np.int64) + 3) % 7  # 1970-01-01 was a Thursday
+        return fifteenth + (2 - w) % 7
 
 
 class Date(DateExtrasMixin, DateBusinessMixin, _pendulum.Date):
@@ -755,27 +1306,52 @@ class Date(DateExtrasMixin, DateBusinessMixin, _pendulum.Date):
         ...
         ValueError: Failed to parse date: bad date
         """
+        if not s or not isinstance(s, str):
+            return cls._parse(s, fmt, entity, raise_err)
+        today = _local_today()
+        d = cls._parse_cached(s, fmt, entity, today)
+        if d is None:
+            return cls._parse(s, fmt, entity, raise_err, today) if raise_err else None
+        return copy.copy(d)
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _parse_cached(cls, s: str, fmt: str, entity: Entity, today: _datetime.date) -> Self | None:
+        """Memoized parse, keyed on today since symbols (T, P-1b) and
+        strings without a year resolve against the current date.
+        """
+        return cls._parse(s, fmt, entity, today=today)
+
+    @classmethod
+    def _parse(
+        cls,
+        s: str | None,
+        fmt: str = None,
+        entity: Entity = NYSE,
+        raise_err: bool = False,
+        today: _datetime.date | None = None,
+    ) -> Self | None:
+        # one clock read per call, shared by every relative value below
+        today = today or _local_today()
 
         def date_for_symbol(s):
-            if s == 'N':
-                return cls.today()
-            if s == 'T':
-                return cls.today()
+            d = cls(today.year, today.month, today.day)
+            if s in {'N', 'T'}:
+                return d
             if s == 'Y':
-                return cls.today().subtract(days=1)
+                return d.subtract(days=1)
             if s == 'P':
-                return cls.today().entity(entity).business().subtract(days=1)
+                return d.entity(entity).business().subtract(days=1)
             if s == 'M':
-                return cls.today().start_of('month').subtract(days=1)
+                return d.start_of('month').subtract(days=1)
 
         def year(m):
-            try:
-                yy = int(m.group('y'))
-                if yy < 100:
-                    yy += 2000
-            except IndexError:
+            if m.group('y') is None:
                 logger.debug('Using default this year')
-                yy = cls.today().year
+                return today.year
+            yy = int(m.group('y'))
+            if len(m.group('y')) <= 2:
+                yy = DATEUTIL_PARSERINFO.convertyear(yy)
             return yy
 
         if not s:
@@ -794,6 +1370,17 @@ class Date(DateExtrasMixin, DateBusinessMixin, _pendulum.Date):
                     raise ValueError(f'Unable to parse {s} using fmt {fmt}')
                 return
 
+        # yyyy-mm-dd, yyyymmdd and other ISO shapes skip the regexes
+        if len(s) == 10 and s[4] == s[7] == '-':
+            with contextlib.suppress(ValueError):
+                d = _datetime.date.fromisoformat(s)
+                return cls(d.year, d.month, d.day)
+        elif len(s) == 8 and s.isdecimal():
+            with contextlib.suppress(ValueError):
+                return cls(int(s[:4]), int(s[4:6]), int(s[6:]))
+        elif d := _parse_iso_datetime(s):
+            return cls(d.year, d.month, d.day)
+
         with contextlib.suppress(ValueError):
             if float(s) and not len(s) == 8: # 20000101
                 if raise_err:
@@ -801,61 +1388,46 @@ class Date(DateExtrasMixin, DateBusinessMixin, _pendulum.Date):
                 return
 
         # special shortcode symbolic values: T, Y-2, P-1b
-        if m := DATEMATCH.match(s):
-            d = date_for_symbol(m.groupdict().get('d'))
-            n = m.groupdict().get('n')
-            if not n:
+        if shortcode := _parse_shortcode(s):
+            symbol, n, b = shortcode
+            d = date_for_symbol(symbol)
+            if n is None:
                 return d
-            n = int(n)
-            b = m.groupdict().get('b')
             if b:
-                assert b == 'b'
                 d = d.entity(entity).business().add(days=n)
             else:
                 d = d.add(days=n)
             return d
         if 'today' in s.lower():
-            return cls.today()
+            return date_for_symbol('T')
         if 'yester' in s.lower():
-            return cls.today().subtract(days=1)
-
-        with contextlib.suppress(TypeError, ValueError):
-            return cls.instance(_dateutil.parser.parse(s))
-
-        # Regex with Month Numbers
-        exps = (
-            r'^(?P<m>\d{1,2})[/-](?P<d>\d{1,2})[/-](?P<y>\d{4})$',
-            r'^(?P<m>\d{1,2})[/-](?P<d>\d{1,2})[/-](?P<y>\d{1,2})$',
-            r'^(?P<m>\d{1,2})[/-](?P<d>\d{1,2})$',
-            r'^(?P<y>\d{4})-(?P<m>\d{1,2})-(?P<d>\d{1,2})$',
-            r'^(?P<y>\d{4})(?P<m>\d{2})(?P<d>\d{2})$',
-        )
-        for exp in exps:
-            if m := re.match(exp, s):
-                mm = int(m.group('m'))
-                dd = int(m.group('d'))
-                yy = year(m)
+            return date_for_symbol('Y')
+
+        # Regex with Month Numbers (out of range values, ie 13/1/2003,
+        # are left to dateutil)
+        if m := DATE_NUMERIC_MATCH.match(s):
+            mm = int(m.group('m'))
+            dd = int(m.group('d'))
+            yy = year(m)
+            with contextlib.suppress(ValueError):
                 return cls(yy, mm, dd)
 
-        # Regex with Month Name
-        exps = (
-            r'^(?P<d>\d{1,2})[- ](?P<m>[A-Za-z]{3,})[- ](?P<y>\d{4})$',
-            r'^(?P<m>[A-Za-z]{3,})[- ](?P<d>\d{1,2})[- ](?P<y>\d{4})$',
-            r'^(?P<m>[A-Za-z]{3,}) (?P<d>\d{1,2}), (?P<y>\d{4})$',
-            r'^(?P<d>\d{2})(?P<m>[A-Z][a-z]{2})(?P<y>\d{4})$',
-            r'^(?P<d>\d{1,2})-(?P<m>[A-Z][a-z][a-z])-(?P<y>\d{2})$',
-            r'^(?P<d>\d{1,2})-(?P<m>[A-Z]{3})-(?P<y>\d{2})$',
-        )
-        for exp in exps:
-            if m := re.match(exp, s):
-                try:
-                    mm = MONTH_SHORTNAME[m.group('m').lower()[:3]]
-                except KeyError:
-                    logger.debug('Month name did not match MONTH_SHORTNAME')
-                    continue
+        # Regex with Month Name (alternatives share the month token, so a
+        # miss on the first matching branch is a miss on all of them)
+        if m := DATE_MONTHNAME_MATCH.match(s):
+            token = m.group('m')
+            mm = MONTH_LOOKUP.get(token) or MONTH_SHORTNAME.get(token.lower()[:3])
+            if mm is None:
+                logger.debug('Month name did not match MONTH_SHORTNAME')
+            else:
                 dd = int(m.group('d'))
                 yy = year(m)
-                return cls(yy, mm, dd)
+                with contextlib.suppress(ValueError):
+                    return cls(yy, mm, dd)
+
+        # generic parser only for what the regex batteries miss
+        with contextlib.suppress(TypeError, ValueError):
+            return cls.instance(_dateutil.parser.parse(s))
 
         if raise_err:
             raise ValueError('Failed to parse date: %s', s)
@@ -887,24 +1459,57 @@ class Date(DateExtrasMixin, DateBusinessMixin, _pendulum.Date):
         >>> Date.instance(None)
 
         """
-        if pd.isna(obj):
+        if obj.__class__ is cls:
+            return obj
+
+        if _is_missing(obj):
             if raise_err:
                 raise ValueError('Empty value')
             return
 
-        if obj.__class__ == cls:
-            return obj
-
-        if isinstance(obj, np.datetime64 | pd.Timestamp):
+        if isinstance(obj, np.datetime64):
+            obj = obj.astype('datetime64[D]').item()
+        elif isinstance(obj, pd.Timestamp):
             obj = DateTime.instance(obj)
 
         return cls(obj.year, obj.month, obj.day)
 
+    @classmethod
+    def instance_array(cls, arr: np.ndarray | pd.DatetimeIndex | pd.Series) -> list[Self | None]:
+        """`instance` over a datetime64 array, DatetimeIndex or Series
+
+        >>> Date.instance_array(np.array(['2022-01-01', 'NaT'], dtype='datetime64[D]'))
+        [Date(2022, 1, 1), None]
+        """
+        return [None if d is None else cls(d.year, d.month, d.day)
+                for d in _datetime64_values(arr, 'D')]
+
     @classmethod
     def today(cls):
-        d = _datetime.datetime.now(LCL)
+        d = _local_today()
         return cls(d.year, d.month, d.day)
 
+    def average(self, dt: _datetime.date | None = None) -> Self:
+        return self._with_entity(super().average(dt))
+
+    def closest(self, dt1: _datetime.date, dt2: _datetime.date) -> Self:
+        return self._with_entity(super().closest(dt1, dt2))
+
+    def farthest(self, dt1: _datetime.date, dt2: _datetime.date) -> Self:
+        return self._with_entity(super().farthest(dt1, dt2))
+
+    def nth_of(self, unit: str, nth: int, day_of_week: WeekDay) -> Self:
+        return self._with_entity(super().nth_of(unit, nth, day_of_week))
+
+    def replace(self, year: int | None = None, month: int | None = None,
+                day: int | None = None) -> Self:
+        """Replace fields, keeping the entity
+
+        >>> Date(2022, 1, 1).entity(NYSE).replace(day=3)._entity
+        <class '...NYSE'>
+        """
+        return self._with_entity(super().replace(year, month, day))
+
     def isoweek(self):
         """Week number 1-52 following ISO week-numbering
 
@@ -936,8 +1541,7 @@ class Date(DateExtrasMixin, DateBusinessMixin, _pendulum.Date):
         Date(2018, 11, 7)
         """
         def _lookback(years=0, months=0, weeks=0, days=0):
-            _business = self._business
-            self._business = False
+            _business = self._take_business()
             d = self\
                 .subtract(years=years, months=months, weeks=weeks, days=days)
             if _business:
@@ -991,26 +1595,27 @@ class Time(_pendulum.Time):
         Time(21, 30, 0, tzinfo=Timezone('UTC'))
         >>> Time.parse('093015,751 PM')
         Time(21, 30, 15, 751000, tzinfo=Timezone('UTC'))
+        >>> Time.parse('09:30:15.123456')
+        Time(9, 30, 15, 123456, tzinfo=Timezone('UTC'))
+        >>> Time.parse('9:30:15.1')
+        Time(9, 30, 15, 100000, tzinfo=Timezone('UTC'))
         """
+        if not s or not isinstance(s, str):
+            return cls._parse(s, fmt, raise_err)
+        t = cls._parse_cached(s, fmt)
+        if t is None and raise_err:
+            return cls._parse(s, fmt, raise_err)
+        return t
 
-        def seconds(m):
-            try:
-                return int(m.group('s'))
-            except Exception:
-                return 0
-
-        def micros(m):
-            try:
-                return int(m.group('u'))
-            except Exception:
-                return 0
-
-        def is_pm(m):
-            try:
-                return m.group('ap').lower() == 'pm'
-            except Exception:
-                return False
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _parse_cached(cls, s: str, fmt: str | None) -> Self | None:
+        """Memoized parse, times are immutable so results are shared.
+        """
+        return cls._parse(s, fmt)
 
+    @classmethod
+    def _parse(cls, s: str | None, fmt: str | None = None, raise_err: bool = False) -> Self | None:
         if not s:
             if raise_err:
                 raise ValueError('Empty value')
@@ -1027,20 +1632,22 @@ class Time(_pendulum.Time):
                     raise ValueError(f'Unable to parse {s} using fmt {fmt}')
                 return
 
-        exps = (
-            r'^(?P<h>\d{1,2})[:.](?P<m>\d{2})([:.](?P<s>\d{2})([.,](?P<u>\d+))?)?( +(?P<ap>[aApP][mM]))?$',
-            r'^(?P<h>\d{2})(?P<m>\d{2})((?P<s>\d{2})([.,](?P<u>\d+))?)?( +(?P<ap>[aApP][mM]))?$',
-        )
-
-        for exp in exps:
-            if m := re.match(exp, s):
-                hh = int(m.group('h'))
-                mm = int(m.group('m'))
-                ss = seconds(m)
-                uu = micros(m)
-                if is_pm(m) and hh < 12:
-                    hh += 12
-                return cls(hh, mm, ss, uu * 1000)
+        # C parser for plain hh:mm[:ss[.f]], zoned ones keep dateutil's tzinfo
+        if s[2:3] == ':':
+            with contextlib.suppress(ValueError):
+                t = _datetime.time.fromisoformat(s)
+                if t.tzinfo is None:
+                    return cls(t.hour, t.minute, t.second, t.microsecond)
+
+        if m := TIME_MATCH.match(s):
+            gd = m.groupdict()
+            hh = int(gd['h'])
+            mm = int(gd['m'])
+            ss = int(gd['s'] or 0)
+            uu = int((gd['u'] or '0')[:6].ljust(6, '0'))
+            if hh < 12 and (gd['ap'] or '').lower() == 'pm':
+                hh += 12
+            return cls(hh, mm, ss, uu)
 
         with contextlib.suppress(TypeError, ValueError):
             return cls.instance(_dateutil.parser.parse(s))
@@ -1073,14 +1680,14 @@ class Time(_pendulum.Time):
         Time(12, 30, 1)
 
         """
-        if pd.isna(obj):
+        if obj.__class__ is cls and not tz:
+            return obj
+
+        if _is_missing(obj):
             if raise_err:
                 raise ValueError('Empty value')
             return
 
-        if obj.__class__ == cls and not tz:
-            return obj
-
         tz = tz or obj.tzinfo or UTC
 
         return cls(obj.hour, obj.minute, obj.second, obj.microsecond, tzinfo=tz)
@@ -1095,7 +1702,7 @@ class Time(_pendulum.Time):
         Time(6, 0, 0, tzinfo=Timezone('America/Sao_Paulo'))
 
         """
-        _dt = DateTime.combine(Date.today(), self, tzinfo=self.tzinfo or UTC)
+        _dt = DateTime.combine(_local_today(), self, tzinfo=self.tzinfo or UTC)
         return _dt.in_timezone(tz).time()
 
     in_tz = in_timezone
@@ -1119,9 +1726,10 @@ class DateTime(DateBusinessMixin, _pendulum.DateTime):
         elif tz is UTC or tz == 'UTC':
             d = _datetime.datetime.now(UTC)
         else:
-            d = _datetime.datetime.now(UTC)
-            tz = _pendulum._safe_timezone(tz)
-            d = d.astimezone(tz)
+            tz = _resolve_tz(tz)
+            if not isinstance(tz, _pendulum.Timezone | _pendulum.FixedTimezone):
+                tz = _pendulum._safe_timezone(tz)
+            d = _datetime.datetime.now(tz)
         return cls(d.year, d.month, d.day, d.hour, d.minute, d.second,
                    d.microsecond, tzinfo=d.tzinfo, fold=d.fold)
 
@@ -1131,8 +1739,31 @@ class DateTime(DateBusinessMixin, _pendulum.DateTime):
         """
         return DateTime.now(tz).start_of('day')
 
-    def date(self):
-        return Date(self.year, self.month, self.day)
+    def date(self) -> Date:
+        """Date part, keeping the entity
+
+        >>> DateTime(2022, 1, 1, 12, 30).date()
+        Date(2022, 1, 1)
+        """
+        return self._with_entity(Date(self.year, self.month, self.day))
+
+    def astimezone(self, tz: _datetime.tzinfo | None = None) -> Self:
+        return self._with_entity(super().astimezone(tz))
+
+    def in_timezone(self, tz: str | _zoneinfo.ZoneInfo | _datetime.tzinfo) -> Self:
+        return self._with_entity(super().in_timezone(tz))
+
+    def in_tz(self, tz: str | _zoneinfo.ZoneInfo | _datetime.tzinfo) -> Self:
+        return self.in_timezone(tz)
+
+    def replace(self, year: int | None = None, month: int | None = None,
+                day: int | None = None, hour: int | None = None,
+                minute: int | None = None, second: int | None = None,
+                microsecond: int | None = None,
+                tzinfo: bool | _datetime.tzinfo | None = True,
+                fold: int | None = None) -> Self:
+        return self._with_entity(super().replace(
+            year, month, day, hour, minute, second, microsecond, tzinfo, fold))
 
     @classmethod
     def combine(
@@ -1207,6 +1838,30 @@ class DateTime(DateBusinessMixin, _pendulum.DateTime):
         >>> _.month, _.day, _.hour, _.minute
         (9, 27, 17, 11)
         """
+        if not s or not isinstance(s, str):
+            return cls._parse(s, entity, raise_err)
+        today = _local_today()
+        d = cls._parse_cached(s, entity, today)
+        if d is None:
+            return cls._parse(s, entity, raise_err, today) if raise_err else None
+        return copy.copy(d)
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _parse_cached(cls, s: str, entity: Entity, today: _datetime.date) -> Self | None:
+        """Memoized parse, keyed on today since relative and partial
+        strings (T-1b, 9:30, Sep 27) resolve against the current date.
+        """
+        return cls._parse(s, entity, today=today)
+
+    @classmethod
+    def _parse(
+        cls,
+        s: str | int | None,
+        entity: Entity = NYSE,
+        raise_err: bool = False,
+        today: _datetime.date | None = None,
+    ) -> Self | None:
         if not s:
             if raise_err:
                 raise ValueError('Empty value')
@@ -1216,8 +1871,12 @@ class DateTime(DateBusinessMixin, _pendulum.DateTime):
             raise TypeError(f'Invalid type for datetime parse: {s.__class__}')
 
         if isinstance(s, int | float):
-            iso = _datetime.datetime.fromtimestamp(s).isoformat()
-            return cls.parse(iso).replace(tzinfo=LCL)
+            d = _datetime.datetime.fromtimestamp(s, tz=LCL)
+            return cls(d.year, d.month, d.day, d.hour, d.minute, d.second,
+                       d.microsecond, tzinfo=LCL, fold=d.fold)
+
+        if d := _parse_iso_datetime(s):
+            return cls.instance(d)
 
         with contextlib.suppress(ValueError, TypeError):
             return cls.instance(_dateutil.parser.parse(s))
@@ -1234,10 +1893,10 @@ class DateTime(DateBusinessMixin, _pendulum.DateTime):
         if d is not None:
             return cls(d.year, d.month, d.day, 0, 0, 0)
 
-        current = Date.today()
+        today = today or _local_today()
         t = Time.parse(s)
         if t is not None:
-            return cls.combine(current, t, LCL)
+            return cls.combine(Date.instance(today), t, LCL)
 
         if raise_err:
             raise ValueError('Invalid date-time format: %s', s)
@@ -1290,49 +1949,256 @@ class DateTime(DateBusinessMixin, _pendulum.DateTime):
         DateTime(2000, 1, 1, 0, 0, 0, tzinfo=Timezone('...'))
 
         """
-        if pd.isna(obj):
+        if obj.__class__ is cls and not tz:
+            return obj
+
+        if _is_missing(obj):
             if raise_err:
                 raise ValueError('Empty value')
             return
 
-        if obj.__class__ == cls and not tz:
-            return obj
+        handler = _DATETIME_INSTANCE.get(obj.__class__)
+        if handler is None:
+            handler = _datetime_instance_handler(obj.__class__)
+        return handler(cls, obj, tz)
 
-        if isinstance(obj, pd.Timestamp):
-            obj = obj.to_pydatetime()
-            return cls.instance(obj, tz=tz or UTC)
-        if isinstance(obj, np.datetime64):
-            obj = np.datetime64(obj, 'us').astype(_datetime.datetime)
-            return cls.instance(obj, tz=tz or UTC)
+    @classmethod
+    def instance_array(
+        cls,
+        arr: np.ndarray | pd.DatetimeIndex | pd.Series,
+        tz: str | _zoneinfo.ZoneInfo | _datetime.tzinfo | None = None,
+    ) -> list[Self | None]:
+        """`instance` over a datetime64 array, DatetimeIndex or Series
 
-        if obj.__class__ == Date:
-            return cls(obj.year, obj.month, obj.day, tzinfo=tz or UTC)
-        if isinstance(obj, _datetime.date) and not isinstance(obj, _datetime.datetime):
-            return cls(obj.year, obj.month, obj.day, tzinfo=tz or UTC)
+        >>> DateTime.instance_array(np.array(['2022-01-01T03:04', 'NaT'], dtype='datetime64[m]'))
+        [DateTime(2022, 1, 1, 3, 4, 0, tzinfo=Timezone('UTC')), None]
+        """
+        tz = _resolve_tz(tz) or UTC
+        return [None if d is None else
+                cls(d.year, d.month, d.day, d.hour, d.minute, d.second,
+                    d.microsecond, tzinfo=tz)
+                for d in _datetime64_values(arr, 'us')]
 
-        tz = tz or obj.tzinfo or UTC
 
-        if obj.__class__ == Time:
-            return cls.combine(Date.today(), obj, tzinfo=tz)
-        if isinstance(obj, _datetime.time):
-            return cls.combine(Date.today(), obj, tzinfo=tz)
+def _datetime_from_timestamp(cls, obj, tz):
+    return cls.instance(obj.to_pydatetime(), tz=tz or UTC)
+
 
-        return cls(obj.year, obj.month, obj.day, obj.hour, obj.minute,
-                   obj.second, obj.microsecond, tzinfo=tz)
+def _datetime_from_datetime64(cls, obj, tz):
+    obj = obj.astype('datetime64[us]').item()
+    return cls(obj.year, obj.month, obj.day, obj.hour, obj.minute,
+               obj.second, obj.microsecond, tzinfo=tz or UTC)
+
+
+def _datetime_from_date(cls, obj, tz):
+    return cls(obj.year, obj.month, obj.day, tzinfo=tz or UTC)
+
+
+def _datetime_from_time(cls, obj, tz):
+    return cls.combine(_local_today(), obj, tzinfo=tz or obj.tzinfo or UTC)
+
+
+def _datetime_from_datetime(cls, obj, tz):
+    return cls(obj.year, obj.month, obj.day, obj.hour, obj.minute,
+               obj.second, obj.microsecond, tzinfo=tz or obj.tzinfo or UTC)
+
+
+# exact class to DateTime.instance conversion, subclasses resolved on first use
+_DATETIME_INSTANCE = {
+    pd.Timestamp: _datetime_from_timestamp,
+    np.datetime64: _datetime_from_datetime64,
+    _datetime.date: _datetime_from_date,
+    _pendulum.Date: _datetime_from_date,
+    Date: _datetime_from_date,
+    _datetime.time: _datetime_from_time,
+    _pendulum.Time: _datetime_from_time,
+    Time: _datetime_from_time,
+    _datetime.datetime: _datetime_from_datetime,
+    _pendulum.DateTime: _datetime_from_datetime,
+    DateTime: _datetime_from_datetime,
+}
+
+
+def _datetime_instance_handler(typ: type):
+    """Resolve (and remember) the conversion for a class not in the table
+    """
+    if issubclass(typ, pd.Timestamp):
+        handler = _datetime_from_timestamp
+    elif issubclass(typ, np.datetime64):
+        handler = _datetime_from_datetime64
+    elif issubclass(typ, _datetime.date) and not issubclass(typ, _datetime.datetime):
+        handler = _datetime_from_date
+    elif issubclass(typ, _datetime.time):
+        handler = _datetime_from_time
+    else:
+        handler = _datetime_from_datetime
+    _DATETIME_INSTANCE[typ] = handler
+    return handler
 
 
 class IntervalError(AttributeError):
     pass
 
 
+def _average_year_length(date1, date2):
+    """Algorithm for average year length"""
+    days = _datetime.date(date2.year + 1, 1, 1).toordinal() - _datetime.date(date1.year, 1, 1).toordinal()
+    years = (date2.year - date1.year) + 1
+    return days / years
+
+
+@lru_cache(maxsize=4096)
+def _days_in_month(year: int, month: int) -> int:
+    return calendar.monthrange(year, month)[1]
+
+
+def _is_end_of_month(d):
+    return d.day == _days_in_month(d.year, d.month)
+
+
+def _feb29_between(date1, date2):
+    """Requires date2.year = (date1.year + 1) or date2.year = date1.year.
+
+    Returns True if "Feb 29" is between the two dates (date1 may be Feb29).
+    Two possibilities: date1.year is a leap year, and date1 <= Feb 29 y1,
+    or date2.year is a leap year, and date2 > Feb 29 y2.
+    """
+    mar1_date1_year = _datetime.date(date1.year, 3, 1)
+    if calendar.isleap(date1.year) and (date1 < mar1_date1_year) and (date2 >= mar1_date1_year):
+        return True
+    mar1_date2_year = _datetime.date(date2.year, 3, 1)
+    return bool(calendar.isleap(date2.year) and date2 >= mar1_date2_year and date1 < mar1_date2_year)
+
+
+def _appears_lte_one_year(date1, date2):
+    """Returns True if date1 and date2 "appear" to be 1 year or less apart.
+
+    This compares the values of year, month, and day directly to each other.
+    Requires date1 <= date2; returns boolean. Used by basis 1.
+    """
+    if date1.year == date2.year:
+        return True
+    return bool(date1.year + 1 == date2.year and (date1.month > date2.month or date1.month == date2.month and date1.day >= date2.day))
+
+
+def _yearfrac_basis0(date1, date2):
+    # change day-of-month for purposes of calculation (US 30/360).
+    date1day, date1month, date1year = date1.day, date1.month, date1.year
+    date2day, date2month, date2year = date2.day, date2.month, date2.year
+    # Feb end-of-month counts as day 30, "illegal" Feb 30 date.
+    date1feb = date1month == 2 and date1day == _days_in_month(date1year, 2)
+    # Note: If date2day==31, it STAYS 31 if date1day < 30.
+    date2day = 30 if (date2day == 31 and date1day >= 30) or (
+        date1feb and date2month == 2 and date2day == _days_in_month(date2year, 2)
+    ) else date2day
+    date1day = 30 if date1day == 31 or date1feb else date1day
+    daydiff360 = (date2day + date2month * 30 + date2year * 360) \
+        - (date1day + date1month * 30 + date1year * 360)
+    return daydiff360 / 360
+
+
+def _yearfrac_basis1(date1, date2):
+    if _appears_lte_one_year(date1, date2):
+        if date1.year == date2.year and calendar.isleap(date1.year):
+            year_length = 366.0
+        elif _feb29_between(date1, date2) or (date2.month == 2 and date2.day == 29):
+            year_length = 366.0
+        else:
+            year_length = 365.0
+        return (date2 - date1).days / year_length
+    return (date2 - date1).days / _average_year_length(date1, date2)
+
+
+def _yearfrac_basis2(date1, date2):
+    return (date2 - date1).days / 360.0
+
+
+def _yearfrac_basis3(date1, date2):
+    return (date2 - date1).days / 365.0
+
+
+def _yearfrac_basis4(date1, date2):
+    # change day-of-month for purposes of calculation.
+    date1day, date1month, date1year = date1.day, date1.month, date1.year
+    date2day, date2month, date2year = date2.day, date2.month, date2.year
+    date1day = min(date1day, 30)
+    date2day = min(date2day, 30)
+    # Remarkably, do NOT change Feb. 28 or 29 at ALL.
+    daydiff360 = (date2day + date2month * 30 + date2year * 360) - \
+        (date1day + date1month * 30 + date1year * 360)
+    return daydiff360 / 360
+
+
+_YEARFRAC_BASIS = {
+    0: _yearfrac_basis0,
+    1: _yearfrac_basis1,
+    2: _yearfrac_basis2,
+    3: _yearfrac_basis3,
+    4: _yearfrac_basis4,
+}
+
+
+@lru_cache(maxsize=65536)
+def _yearfrac(ordinal1: int, ordinal2: int, basis: int) -> float:
+    """Year fraction between two ordinals (ordinal1 < ordinal2)"""
+    date1 = _datetime.date.fromordinal(ordinal1)
+    date2 = _datetime.date.fromordinal(ordinal2)
+    return _YEARFRAC_BASIS[basis](date1, date2)
+
+
+class _DateSeries:
+    """Iterator over dates held as an ordinal array, which (unlike a
+    generator) also answers `len` and indexing for the remaining dates
+
+    >>> s = Interval(Date(2014, 7, 12), Date(2014, 7, 16)).series()
+    >>> len(s), s[0], s[-1]
+    (5, Date(2014, 7, 12), Date(2014, 7, 16))
+    >>> next(s), len(s), list(s[:2])
+    (Date(2014, 7, 12), 4, [Date(2014, 7, 13), Date(2014, 7, 14)])
+    """
+
+    def __init__(self, ordinals: np.ndarray, entity: type[NYSE]):
+        self._ordinals = ordinals
+        self._entity = entity
+        self._dates = None  # datetime.date list, converted in bulk on first use
+        self._pos = 0
+
+    def _date(self, i: int) -> Date:
+        if self._dates is None:
+            self._dates = _ordinals_to_dates(self._ordinals)
+        d = self._dates[i]
+        d = Date(d.year, d.month, d.day)
+        if d._entity is not self._entity:
+            d._entity = self._entity
+        return d
+
+    def __iter__(self) -> Self:
+        return self
+
+    def __next__(self) -> Date:
+        if self._pos >= len(self._ordinals):
+            raise StopIteration
+        self._pos += 1
+        return self._date(self._pos - 1)
+
+    def __len__(self) -> int:
+        return len(self._ordinals) - self._pos
+
+    def __getitem__(self, key: int | slice) -> Date | Self:
+        if isinstance(key, slice):
+            return _DateSeries(self._ordinals[self._pos:][key], self._entity)
+        return self._date(self._pos + range(len(self))[key])
+
+
 class Interval:
 
-    _business: bool = False
-    _entity: type[NYSE] = NYSE
+    __slots__ = ('begdate', 'enddate', '_business', '_entity')
 
     def __init__(self, begdate: str | Date | None = None, enddate: str | Date | None = None):
         self.begdate = Date.parse(begdate) if isinstance(begdate, str) else Date.instance(begdate)
         self.enddate = Date.parse(enddate) if isinstance(enddate, str) else Date.instance(enddate)
+        self._business = False
+        self._entity = NYSE
 
     def business(self) -> Self:
         self._business = True
@@ -1412,8 +2278,8 @@ class Interval:
         else:
             enddate = begdate.add(days=window) if window else begdate
 
-        enddate._business = False
-        begdate._business = False
+        enddate._take_business()
+        begdate._take_business()
 
         return begdate, enddate
 
@@ -1425,8 +2291,38 @@ class Interval:
         >>> list(Interval(Date(2021, 11, 22),Date(2021, 11, 28)).is_business_day_series())
         [True, True, True, False, True, False, False]
         """
-        for thedate in self.series():
-            yield thedate.is_business_day()
+        yield from map(bool, self.is_business_day_array())
+
+    def is_business_day_array(self) -> np.ndarray:
+        """Business day flags over the days of `series`, in one bitmap lookup,
+        checked against the entity of the first date like `series` itself
+
+        >>> Interval(Date(2018, 11, 19), Date(2018, 11, 25)).is_business_day_array()
+        array([ True,  True,  True, False,  True, False, False])
+        """
+        since, until = self._series_bounds()
+        ordinals = np.arange(since.toordinal(), until.toordinal() + 1)
+        flags = since._entity.is_business_day_vec(ordinals)
+        return flags[flags] if self._business else flags
+
+    def _series_bounds(self, window=0) -> tuple[Date, Date]:
+        """Resolve `series` endpoints from begdate, enddate and window"""
+        window = abs(int(window))
+        since, until = self.begdate, self.enddate
+        _business = self._business
+        assert until or since, 'Since or until is required'
+        if not since and until:
+            since = (until.business() if _business else
+                     until).subtract(days=window)
+        elif since and not until:
+            until = (since.business() if _business else
+                     since).add(days=window)
+        assert since <= until, 'Since date must be earlier or equal to Until date'
+        # consume the flags Interval.b set, like range(), so the caller's
+        # dates do not stay business day adders
+        since._take_business()
+        until._take_business()
+        return since, until
 
     def series(self, window=0):
         """Get a series of datetime.date objects.
@@ -1466,25 +2362,11 @@ class Interval:
         >>> len(list(Interval(Date(2015,1,3), None).b.series(window=5)))
         5
         """
-        window = abs(int(window))
-        since, until = self.begdate, self.enddate
-        _business = self._business
-        assert until or since, 'Since or until is required'
-        if not since and until:
-            since = (until.business() if _business else
-                     until).subtract(days=window)
-        elif since and not until:
-            until = (since.business() if _business else
-                     since).add(days=window)
-        assert since <= until, 'Since date must be earlier or equal to Until date'
-        thedate = since
-        while thedate <= until:
-            if _business:
-                if thedate.is_business_day():
-                    yield thedate
-            else:
-                yield thedate
-            thedate = thedate.add(days=1)
+        since, until = self._series_bounds(window)
+        ordinals = np.arange(since.toordinal(), until.toordinal() + 1)
+        if self._business:
+            ordinals = ordinals[since._entity.is_business_day_vec(ordinals)]
+        return _DateSeries(ordinals, since._entity)
 
     def start_of_series(self, unit='month') -> list[Date]:
         """Return a series between and inclusive of begdate and enddate.
@@ -1511,6 +2393,16 @@ class Interval:
         >>> Interval(Date(2018, 1, 5), Date(2018, 4, 5)).end_of_series('week')
         [Date(2018, 1, 7), Date(2018, 1, 14), ..., Date(2018, 4, 8)]
         """
+        fast = not self._business and self.begdate <= self.enddate
+        if unit == 'month' and fast:
+            months = range(self.begdate.year * 12 + self.begdate.month - 1,
+                           self.enddate.year * 12 + self.enddate.month)
+            return [Date(y, m + 1, _days_in_month(y, m + 1))
+                    for y, m in (divmod(n, 12) for n in months)]
+        if unit == 'week' and fast:
+            sundays = range(self.begdate.toordinal() - self.begdate.weekday() + 6,
+                            self.enddate.toordinal() - self.enddate.weekday() + 7, 7)
+            return [Date(d.year, d.month, d.day) for d in _ordinals_to_dates(sundays)]
         begdate = self.begdate.end_of(unit)
         enddate = self.enddate.end_of(unit)
         interval = _pendulum.interval(begdate, enddate)
@@ -1534,12 +2426,19 @@ class Interval:
             return 0
         if not self._business:
             return (self.enddate - self.begdate).days
+        # counted like series(), with the entity of the earlier date
+        first = min(self.begdate, self.enddate)
+        lo, hi = sorted((self.begdate.toordinal(), self.enddate.toordinal()))
+        if (count := first._entity._business_day_count(lo, hi)) is not None:
+            self.begdate._take_business()
+            self.enddate._take_business()
+            return count - 1 if self.begdate < self.enddate else 1 - count
         if self.begdate < self.enddate:
-            return len(list(self.series())) - 1
+            return len(self.series()) - 1
         _reverse = Interval(self.enddate, self.begdate)
         _reverse._entity = self._entity
         _reverse._business = self._business
-        return -len(list(_reverse.series())) + 1
+        return -len(_reverse.series()) + 1
 
     def quarters(self):
         """Return the number of quarters between two dates
@@ -1592,89 +2491,6 @@ class Interval:
         >>> '{:.4f}'.format(Interval(begdate, enddate).years(4))
         '0.9167'
         """
-
-        def average_year_length(date1, date2):
-            """Algorithm for average year length"""
-            days = (Date(date2.year + 1, 1, 1) - Date(date1.year, 1, 1)).days
-            years = (date2.year - date1.year) + 1
-            return days / years
-
-        def feb29_between(date1, date2):
-            """Requires date2.year = (date1.year + 1) or date2.year = date1.year.
-
-            Returns True if "Feb 29" is between the two dates (date1 may be Feb29).
-            Two possibilities: date1.year is a leap year, and date1 <= Feb 29 y1,
-            or date2.year is a leap year, and date2 > Feb 29 y2.
-            """
-            mar1_date1_year = Date(date1.year, 3, 1)
-            if calendar.isleap(date1.year) and (date1 < mar1_date1_year) and (date2 >= mar1_date1_year):
-                return True
-            mar1_date2_year = Date(date2.year, 3, 1)
-            return bool(calendar.isleap(date2.year) and date2 >= mar1_date2_year and date1 < mar1_date2_year)
-
-        def appears_lte_one_year(date1, date2):
-            """Returns True if date1 and date2 "appear" to be 1 year or less apart.
-
-            This compares the values of year, month, and day directly to each other.
-            Requires date1 <= date2; returns boolean. Used by basis 1.
-            """
-            if date1.year == date2.year:
-                return True
-            return bool(date1.year + 1 == date2.year and (date1.month > date2.month or date1.month == date2.month and date1.day >= date2.day))
-
-        def basis0(date1, date2):
-            # change day-of-month for purposes of calculation.
-            date1day, date1month, date1year = date1.day, date1.month, date1.year
-            date2day, date2month, date2year = date2.day, date2.month, date2.year
-            if date1day == 31 and date2day == 31:
-                date1day = 30
-                date2day = 30
-            elif date1day == 31:
-                date1day = 30
-            elif date1day == 30 and date2day == 31:
-                date2day = 30
-            # Note: If date2day==31, it STAYS 31 if date1day < 30.
-            # Special fixes for February:
-            elif date1month == 2 and date2month == 2 and date1 == date1.end_of('month') \
-                and date2 == date2.end_of('month'):
-                date1day = 30  # Set the day values to be equal
-                date2day = 30
-            elif date1month == 2 and date1 == date1.end_of('month'):
-                date1day = 30  # "Illegal" Feb 30 date.
-            daydiff360 = (date2day + date2month * 30 + date2year * 360) \
-                - (date1day + date1month * 30 + date1year * 360)
-            return daydiff360 / 360
-
-        def basis1(date1, date2):
-            if appears_lte_one_year(date1, date2):
-                if date1.year == date2.year and calendar.isleap(date1.year):
-                    year_length = 366.0
-                elif feb29_between(date1, date2) or (date2.month == 2 and date2.day == 29):
-                    year_length = 366.0
-                else:
-                    year_length = 365.0
-                return (date2 - date1).days / year_length
-            return (date2 - date1).days / average_year_length(date1, date2)
-
-        def basis2(date1, date2):
-            return (date2 - date1).days / 360.0
-
-        def basis3(date1, date2):
-            return (date2 - date1).days / 365.0
-
-        def basis4(date1, date2):
-            # change day-of-month for purposes of calculation.
-            date1day, date1month, date1year = date1.day, date1.month, date1.year
-            date2day, date2month, date2year = date2.day, date2.month, date2.year
-            if date1day == 31:
-                date1day = 30
-            if date2day == 31:
-                date2day = 30
-            # Remarkably, do NOT change Feb. 28 or 29 at ALL.
-            daydiff360 = (date2day + date2month * 30 + date2year * 360) - \
-                (date1day + date1month * 30 + date1year * 360)
-            return daydiff360 / 360
-
         begdate, enddate = self.begdate, self.enddate
         if enddate is None:
             return
@@ -1686,29 +2502,17 @@ class Interval:
         if begdate == enddate:
             return 0.0
 
-        if basis == 0:
-            return basis0(begdate, enddate) * sign
-        if basis == 1:
-            return basis1(begdate, enddate) * sign
-        if basis == 2:
-            return basis2(begdate, enddate) * sign
-        if basis == 3:
-            return basis3(begdate, enddate) * sign
-        if basis == 4:
-            return basis4(begdate, enddate) * sign
-
-        raise ValueError('Basis range [0, 4]. Unknown basis {basis}.')
+        if basis not in _YEARFRAC_BASIS:
+            raise ValueError(f'Basis range [0, 4]. Unknown basis {basis}.')
+        return _yearfrac(begdate.toordinal(), enddate.toordinal(), basis) * sign
 
 
-def create_ics(begdate, enddate, summary, location):
-    """Create a simple .ics file per RFC 5545 guidelines."""
-
-    return f"""BEGIN:VCALENDAR
+_ICS_TEMPLATE = """BEGIN:VCALENDAR
 VERSION:2.0
 PRODID:-//hacksw/handcal//NONSGML v1.0//EN
 BEGIN:VEVENT
-DTSTART;TZID=America/New_York:{begdate:%Y%m%dT%H%M%S}
-DTEND;TZID=America/New_York:{enddate:%Y%m%dT%H%M%S}
+DTSTART;TZID=America/New_York:{begdate}
+DTEND;TZID=America/New_York:{enddate}
 SUMMARY:{summary}
 LOCATION:{location}
 END:VEVENT
@@ -1716,32 +2520,45 @@ END:VCALENDAR
     """
 
 
-# apply any missing Date functions
-for func in (
-    'average',
-    'closest',
-    'farthest',
-    'fromordinal',
-    'fromtimestamp',
-    'nth_of',
-    'replace',
-):
-    setattr(Date, func, store_entity(getattr(_pendulum.Date, func), typ=Date))
-
-# apply any missing DateTime functions
-for func in (
-    'astimezone',
-    'date',
-    'fromordinal',
-    'fromtimestamp',
-    'in_timezone',
-    'in_tz',
-    'replace',
-    'strptime',
-    'utcfromtimestamp',
-    'utcnow',
-):
-    setattr(DateTime, func, store_entity(getattr(_pendulum.DateTime, func), typ=DateTime))
+def _ics_stamp(d) -> str:
+    """`%Y%m%dT%H%M%S` without strftime (dates get midnight)"""
+    if isinstance(d, _datetime.datetime):
+        return '%04d%02d%02dT%02d%02d%02d' % (d.year, d.month, d.day, d.hour, d.minute, d.second)
+    return '%04d%02d%02dT000000' % (d.year, d.month, d.day)
+
+
+def create_ics(begdate, enddate, summary, location):
+    """Create a simple .ics file per RFC 5545 guidelines.
+
+    >>> print(create_ics(DateTime(2024, 3, 1, 9, 30), DateTime(2024, 3, 1, 10), 'Call', 'Office'))
+    BEGIN:VCALENDAR
+    ...
+    DTSTART;TZID=America/New_York:20240301T093000
+    DTEND;TZID=America/New_York:20240301T100000
+    ...
+    """
+    return _ICS_TEMPLATE.format_map({
+        'begdate': _ics_stamp(begdate),
+        'enddate': _ics_stamp(enddate),
+        'summary': summary,
+        'location': location,
+    })
+
+
+_ARG_TARGETS.update({
+    _datetime.datetime: DateTime,
+    _datetime.date: Date,
+    _datetime.time: Time,
+})
+
+_TYPE_MAP.update({
+    _datetime.datetime: DateTime,
+    _pendulum.DateTime: DateTime,
+    DateTime: DateTime,
+    _datetime.date: Date,
+    _pendulum.Date: Date,
+    Date: Date,
+})
 
 
 if __name__ == '__main__':
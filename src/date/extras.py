@@ -1,11 +1,16 @@
-from collections import namedtuple
+import datetime as _datetime
+from functools import lru_cache
 
-from date import NYSE, DateTime, Entity
+import numpy as np
+import pendulum as _pendulum
+
+from date import NYSE, Date, DateTime, Entity
 
 __all__ = [
     'is_within_business_hours',
     'is_business_day',
     'overlap_days',
+    'overlap_days_vec',
 ]
 
 
@@ -32,10 +37,21 @@ def is_within_business_hours(entity: Entity = NYSE) -> bool:
     False
 
     """
-    this = DateTime.now()
-    this_entity = DateTime.now(tz=entity.tz).entity(entity)
-    bounds = this_entity.business_hours()
-    return this_entity.business_open() and (bounds[0] <= this.astimezone(entity.tz) <= bounds[1])
+    this = DateTime.now(tz=entity.tz)
+    bounds = _business_bounds(entity, this.date().toordinal())
+    if bounds is None:
+        return False
+    return bounds[0] <= this <= bounds[1]
+
+
+@lru_cache(maxsize=8)
+def _business_bounds(entity: Entity, ordinal: int) -> tuple[DateTime, DateTime] | None:
+    """Open and close for a day ordinal, None when the entity is closed
+    """
+    day = Date.fromordinal(ordinal).entity(entity)
+    if not day.business_open():
+        return
+    return day.business_hours()
 
 
 def is_business_day(entity: Entity = NYSE) -> bool:
@@ -44,7 +60,7 @@ def is_business_day(entity: Entity = NYSE) -> bool:
     return DateTime.now(tz=entity.tz).entity(entity).is_business_day()
 
 
-Range = namedtuple('Range', ['start', 'end'])
+_PLAIN_DATES = {_datetime.date, _pendulum.Date, Date}
 
 
 def overlap_days(range_one, range_two, days=False):
@@ -76,11 +92,35 @@ def overlap_days(range_one, range_two, days=False):
     >>> overlap_days((date3, date4), (date1, date2), True)
     -26
     """
-    r1 = Range(*range_one)
-    r2 = Range(*range_two)
-    latest_start = max(r1.start, r2.start)
-    earliest_end = min(r1.end, r2.end)
-    overlap = (earliest_end - latest_start).days + 1
+    start_one, end_one = range_one
+    start_two, end_two = range_two
+    latest_start = start_one if start_one > start_two else start_two
+    earliest_end = end_one if end_one < end_two else end_two
+    # plain dates count by ordinal, datetimes keep timedelta day flooring
+    if type(latest_start) in _PLAIN_DATES and type(earliest_end) in _PLAIN_DATES:
+        overlap = earliest_end.toordinal() - latest_start.toordinal() + 1
+    else:
+        overlap = (earliest_end - latest_start).days + 1
+    if days:
+        return overlap
+    return overlap >= 0
+
+
+def overlap_days_vec(starts_one, ends_one, starts_two, ends_two, days=False) -> np.ndarray:
+    """Vectorized `overlap_days` over arrays of range endpoints
+
+    >>> overlap_days_vec(['2016-03-01', '2016-03-29'], ['2016-03-29', '2016-03-30'],
+    ...                  ['2016-03-02', '2016-03-01'], ['2016-03-30', '2016-03-02'], True)
+    array([ 28, -26])
+    >>> overlap_days_vec(['2016-03-01'], ['2016-03-29'], ['2016-03-02'], ['2016-03-30'])
+    array([ True])
+    """
+    def ordinals(x):
+        return np.asarray(x, dtype='datetime64[D]').view(np.int64)
+
+    overlap = np.minimum(ordinals(ends_one), ordinals(ends_two))
+    overlap -= np.maximum(ordinals(starts_one), ordinals(starts_two))
+    overlap += 1
     if days:
         return overlap
     return overlap >= 0
@@ -1,7 +1,7 @@
 
 from asserts import assert_equal, assert_false, assert_true
 
-from date import Date, DateTime
+from date import NYSE, Date, DateTime, Interval
 
 
 def test_date_business_date_or_next():
@@ -88,5 +88,72 @@ def test_datetime_is_business_day():
     assert_true(d.subtract(days=2).b.add(days=1).is_business_day())
 
 
+def test_is_business_day_out_of_range():
+    """Dates outside the entity calendar are never business days
+    """
+    assert_false(Date(1850, 1, 3).is_business_day())
+    assert_false(Date(2250, 1, 3).is_business_day())
+    assert_true(Date(1900, 1, 2).is_business_day())
+
+
+def test_nyse_business_days_and_holidays():
+    """Business days and holidays over a range never overlap
+    """
+    begdate, enddate = Date(2024, 1, 1), Date(2024, 12, 31)
+    days = NYSE.business_days(begdate, enddate)
+    holidays = NYSE.business_holidays(begdate, enddate)
+    assert_equal(len(days), 252)
+    open_days = {Date(2024, 1, 2), Date(2024, 7, 3), Date(2024, 11, 29), Date(2024, 12, 24)}
+    closed_days = {Date(2024, 1, 1), Date(2024, 3, 29), Date(2024, 7, 4), Date(2024, 12, 25)}
+    assert_true(open_days <= days)
+    assert_true(closed_days <= holidays)
+    assert_true(days.isdisjoint(closed_days))
+    assert_false(days & holidays)
+    assert_equal(NYSE.business_day_ordinals(begdate, enddate).tolist(),
+                 sorted(d.toordinal() for d in days))
+
+    # sub-ranges across a year end are cut from the per-year schedules
+    begdate, enddate = Date(2023, 12, 20), Date(2024, 1, 5)
+    assert_equal(sorted(NYSE.business_days(begdate, enddate)),
+                 [d for d in Interval(begdate, enddate).series() if d.is_business_day()])
+
+    # cached results are shared, so they must not be mutable
+    assert_true(isinstance(days, frozenset))
+    assert_true(isinstance(holidays, frozenset))
+    assert_false(NYSE.business_day_ordinals(begdate, enddate).flags.writeable)
+
+
+def test_nyse_business_hours():
+    """Range schedules across a year end agree with the per-day lookups
+    """
+    hours = NYSE.business_hours(Date(2023, 12, 22), Date(2024, 1, 3))
+    assert_equal(list(hours), [d for d in Interval(Date(2023, 12, 22), Date(2024, 1, 3)).series()
+                               if d.is_business_day()])
+    for d, (open_, close) in hours.items():
+        assert_equal((open_, close), Date.instance(d).business_hours())
+    assert_equal(hours[Date(2024, 1, 2)][1], DateTime(2024, 1, 2, 16, 0, tzinfo=NYSE.tz))
+
+
+def test_business_day_vec():
+    """Array helpers agree with the scalar business day logic
+    """
+    dates = [Date(2024, 12, d) for d in range(20, 32)]
+    ordinals = [d.toordinal() for d in dates]
+    flags = NYSE.is_business_day_vec(ordinals)
+    assert_equal(flags.tolist(), [d.is_business_day() for d in dates])
+    for n in (-2, 0, 1, 3):
+        shifted = NYSE.add_business_days_vec(ordinals, n)
+        assert_equal(shifted.tolist(), [d.b.add(days=n).toordinal() for d in dates])
+
+
+def test_shift():
+    """numpy busday shift matches the scalar business arithmetic
+    """
+    dates = [Date(1951, 12, d) for d in range(20, 32)] + [Date(2018, 12, d) for d in range(1, 10)]
+    for n in (-3, -1, 0, 1, 4):
+        shifted = NYSE.shift(dates, n).tolist()
+        assert_equal(shifted, [d.b.add(days=n) for d in dates])
+
+
 if __name__ == '__main__':
     __import__('pytest').main([__file__])
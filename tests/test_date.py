@@ -7,6 +7,7 @@ import pendulum
 import pytest
 from asserts import assert_equal, assert_true
 
+import date
 from date import NYSE, WEEKDAY_SHORTNAME, Date, WeekDay, expect_date
 
 
@@ -337,6 +338,44 @@ def test_expects():
     assert_equal(func(((p, p), p)), [[d, d], d])
     assert_true(isinstance(func((df, p))[0], pd.DataFrame))
 
+    @expect_date(exclkw=True)
+    def func_kw(arg, other=None):
+        return arg, other
+
+    d_, p_ = func_kw(p, other=p)
+    assert_true(type(d_) is Date)
+    assert_true(type(p_) is pendulum.Date)
+
+
+def test_parse_cache():
+    """Repeated strings are cached but each caller gets its own object"""
+    d1 = Date.parse('2022-01-03')
+    d2 = Date.parse('2022-01-03')
+    assert_equal(d1, d2)
+    assert_true(d1 is not d2)
+
+    d1.business()
+    assert_true(d1._business)
+    assert_true(not Date.parse('2022-01-03')._business)
+
+    assert_true(Date.parse('bad date') is None)
+    with pytest.raises(ValueError):
+        Date.parse('bad date', raise_err=True)
+
+
+def test_default_state_not_stored():
+    """Arithmetic on plain dates leaves entity/business at class defaults"""
+    d = Date(2022, 1, 3).add(days=1).subtract(days=1).start_of('month')
+    assert_equal(vars(d), {})
+    b = Date(2022, 1, 3).b.add(days=1)
+    assert_equal(b, Date(2022, 1, 4))
+    assert_true(not b._business)
+
+
+def test_all_exports():
+    for name in date.__all__:
+        assert_true(hasattr(date, name), name)
+
 
 if __name__ == '__main__':
     pytest.main([__file__])
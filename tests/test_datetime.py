@@ -1,4 +1,5 @@
 import copy
+import datetime
 import pickle
 from unittest import mock
 
@@ -8,6 +9,7 @@ import pytest
 from asserts import assert_equal, assert_not_equal, assert_true
 from pendulum.tz import Timezone
 
+import date
 from date import NYSE, UTC, Date, DateTime, Time, expect_datetime, now
 
 
@@ -120,6 +122,39 @@ def test_now():
     DateTime.now()  # basic check
 
 
+def test_helper_timezone_name():
+    """Helpers accept timezone names and resolve them once
+    """
+    d = date.datetime(2022, 1, 1, 12, 30, tzinfo='US/Eastern')
+    assert_equal(d, DateTime(2022, 1, 1, 12, 30, tzinfo=Timezone('US/Eastern')))
+    assert_true(d.tzinfo is date.datetime(2022, 1, 2, tzinfo='US/Eastern').tzinfo)
+
+    t = date.time(9, 30, tzinfo='UTC')
+    assert_equal(t, Time(9, 30, tzinfo=UTC))
+
+    assert_equal(date.now('US/Eastern').tzinfo, Timezone('US/Eastern'))
+
+
+def test_parse_helper_cache():
+    """Cached parse hands out independent copies
+    """
+    d = date.parse('2022-01-01 12:30')
+    d.business()
+    d_ = date.parse('2022-01-01 12:30')
+    assert_equal(d, d_)
+    assert_true(d is not d_)
+    assert_true(d_._business is False)
+
+
+def test_parse_iso_matches_dateutil():
+    """ISO strings skip dateutil but land on the same value
+    """
+    import dateutil.parser
+    for s in ('2014-10-31T14:55:00', '2014/10/31 14:55:00.25',
+              '2014-10-31T14:55:00-04:00', '2014-10-31T14:55:00Z'):
+        assert_equal(DateTime.parse(s), DateTime.instance(dateutil.parser.parse(s)))
+
+
 @mock.patch('date.DateTime.now')
 def test_today(mock):
     mock.return_value = DateTime(2020, 1, 1, 12, 30, tzinfo=UTC)
@@ -154,5 +189,47 @@ def test_expects():
     assert_true(isinstance(func((df, p))[0], pd.DataFrame))
 
 
+def test_constructors_and_entity():
+    """Inherited constructors return our types, derived values keep entity"""
+    assert_equal(type(DateTime.fromordinal(738000)), DateTime)
+    assert_equal(type(DateTime.fromtimestamp(0)), DateTime)
+    assert_equal(DateTime.strptime('2020-01-02', '%Y-%m-%d'), DateTime(2020, 1, 2, tzinfo=UTC))
+    assert_equal(type(Date.fromordinal(738000)), Date)
+
+    d = DateTime(2022, 1, 1, 12, tzinfo=UTC).entity(NYSE)
+    assert_equal(type(d.date()), Date)
+    for x in (d.date(), d.replace(hour=3), d.in_timezone('US/Eastern'), d.astimezone(NYSE.tz)):
+        assert_true(x._entity is NYSE)
+
+
+def test_instance_subclass():
+    """Subclasses of the stdlib types convert like their base class"""
+
+    class MyDate(datetime.date):
+        pass
+
+    class MyDateTime(datetime.datetime):
+        pass
+
+    assert_equal(DateTime.instance(MyDate(2022, 1, 1)),
+                 DateTime(2022, 1, 1, tzinfo=UTC))
+    assert_equal(DateTime.instance(MyDateTime(2022, 1, 1, 3, 4, tzinfo=UTC)),
+                 DateTime(2022, 1, 1, 3, 4, tzinfo=UTC))
+    assert_equal(DateTime.instance(pd.Timestamp('2022-01-01 03:04')),
+                 DateTime(2022, 1, 1, 3, 4, tzinfo=UTC))
+
+
+def test_instance_array():
+    """Array conversion matches converting element by element"""
+    index = pd.date_range('1965-01-01', periods=500, freq='7h13min17s')
+    for arr in (index, index.values, pd.Series(index), index.tz_localize('US/Eastern')):
+        assert_equal(DateTime.instance_array(arr), [DateTime.instance(x) for x in arr])
+        assert_equal(Date.instance_array(arr), [Date.instance(x) for x in arr])
+
+    arr = pd.DatetimeIndex(['2022-01-01 03:04', None])
+    assert_equal(DateTime.instance_array(arr, tz=Timezone('US/Eastern')),
+                 [DateTime(2022, 1, 1, 3, 4, tzinfo=Timezone('US/Eastern')), None])
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -1,7 +1,29 @@
 
+import datetime
+
 from asserts import assert_equal, assert_not_equal
 
-from date import Date, Interval
+from date import Date, Entity, Interval
+
+
+class Weekdays(Entity):
+    """Monday to Friday, no holidays"""
+
+    BEGDATE = datetime.date(2014, 1, 1)
+    ENDDATE = datetime.date(2014, 12, 31)
+
+    @staticmethod
+    def business_days(begdate=BEGDATE, enddate=ENDDATE):
+        days = (begdate + datetime.timedelta(i) for i in range((enddate - begdate).days + 1))
+        return {d for d in days if d.weekday() < 5}
+
+    @staticmethod
+    def business_hours(begdate=BEGDATE, enddate=ENDDATE):
+        return {}
+
+    @staticmethod
+    def business_holidays(begdate=BEGDATE, enddate=ENDDATE):
+        return set()
 
 
 def test_range_basic():
@@ -20,5 +42,79 @@ def test_range_business():
     assert_not_equal(_, (d1, Date(2002, 1, 1)))
 
 
+def test_series_len_and_index():
+    series = Interval(Date(2018, 11, 19), Date(2018, 11, 25)).b.series()
+    assert_equal(len(series), 4)
+    assert_equal(series[-1], Date(2018, 11, 23))
+    assert_equal(next(series), Date(2018, 11, 19))
+    assert_equal(len(series), 3)
+    assert_equal(list(series), [Date(2018, 11, 20), Date(2018, 11, 21), Date(2018, 11, 23)])
+    assert_equal(len(series), 0)
+
+
+def test_business_day_series_uses_date_entity():
+    """Flags follow the entity the dates carry (7/4/14 is an NYSE holiday)"""
+    d = Date(2014, 7, 3).entity(Weekdays)
+    flags = list(Interval(d, Date(2014, 7, 7)).is_business_day_series())
+    assert_equal(flags, [True, True, False, False, True])
+    flags = list(Interval(Date(2014, 7, 3), Date(2014, 7, 7)).is_business_day_series())
+    assert_equal(flags, [True, False, False, False, True])
+
+
+def test_business_series_uses_date_entity():
+    """Business series filter with the same entity the yielded dates carry"""
+    d = Date(2014, 7, 3).entity(Weekdays)
+    series = list(Interval(d, Date(2014, 7, 7)).b.series())
+    assert_equal(series, [Date(2014, 7, 3), Date(2014, 7, 4), Date(2014, 7, 7)])
+    assert_equal({x._entity for x in series}, {Weekdays})
+    series = list(Interval(Date(2014, 7, 3), Date(2014, 7, 7)).b.series())
+    assert_equal(series, [Date(2014, 7, 3), Date(2014, 7, 7)])
+
+
+def test_business_days_uses_date_entity():
+    d = Date(2014, 7, 3).entity(Weekdays)
+    assert_equal(Interval(d, Date(2014, 7, 7)).b.days(), 2)
+    assert_equal(Interval(Date(2014, 7, 7), d).b.days(), -2)
+    assert_equal(Interval(Date(2014, 7, 3), Date(2014, 7, 7)).b.days(), 1)
+
+
+
+def test_business_day_series_consumes_flags():
+    """The caller's dates are left as plain dates"""
+    a, b = Date(2024, 1, 5), Date(2024, 1, 12)
+    assert_equal(sum(Interval(a, b).b.is_business_day_series()), 6)
+    assert_equal(a.add(days=1), Date(2024, 1, 6))
+    assert_equal(b.add(days=1), Date(2024, 1, 13))
+
+
+
+def test_business_series_consumes_flags():
+    """The caller's dates are left as plain dates"""
+    a, b = Date(2024, 1, 5), Date(2024, 1, 12)
+    assert_equal(len(Interval(a, b).b.series()), 6)
+    assert_equal(a.add(days=1), Date(2024, 1, 6))
+    assert_equal(b.add(days=1), Date(2024, 1, 13))
+
+
+
+def test_business_days_consumes_flags():
+    """The caller's dates are left as plain dates"""
+    a, b = Date(2024, 1, 5), Date(2024, 1, 12)
+    assert_equal(Interval(a, b).b.days(), 5)
+    assert_equal(a.add(days=1), Date(2024, 1, 6))
+    assert_equal(b.add(days=1), Date(2024, 1, 13))
+
+
+
+def test_business_end_of_series():
+    """Business intervals keep the end_of path and leave the dates plain"""
+    a, b = Date(2024, 5, 30), Date(2025, 5, 12)
+    series = Interval(a, b).b.end_of_series('month')
+    assert_equal(series[0], Date(2024, 5, 31))
+    assert_equal(series[-1], Date(2025, 4, 30))
+    assert_equal(a.add(days=1), Date(2024, 5, 31))
+    assert_equal(b.add(days=1), Date(2025, 5, 13))
+
+
 if __name__ == '__main__':
     __import__('pytest').main([__file__])